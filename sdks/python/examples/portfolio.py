@@ -18,7 +18,7 @@ async def main():
     client = O2Client(network=Network.TESTNET)
     shutdown_event = asyncio.Event()
 
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     for sig in (signal.SIGINT, signal.SIGTERM):
         loop.add_signal_handler(sig, lambda: shutdown_event.set())
 
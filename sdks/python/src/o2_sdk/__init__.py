@@ -23,6 +23,7 @@ from .crypto import (
     generate_wallet,
     load_evm_wallet,
     load_wallet,
+    load_wallet_bytes,
     personal_sign,
     raw_sign,
     to_fuel_compact_signature,
@@ -71,6 +72,7 @@ from .errors import (
     TooManyActions,
     TooManySubscriptions,
     TradeNotFound,
+    TraderNotWhitelisted,
     WhitelistNotConfigured,
 )
 from .models import (
@@ -123,7 +125,7 @@ from .models import (
     WhitelistResponse,
     WithdrawResponse,
 )
-from .websocket import ConnectionEvent, ConnectionState
+from .websocket import ConnectionEvent, ConnectionState, install_uvloop
 
 __all__ = [
     "GAS_MAX",
@@ -213,6 +215,7 @@ __all__ = [
     "Trade",
     "TradeNotFound",
     "TradeUpdate",
+    "TraderNotWhitelisted",
     "Wallet",
     "WhitelistNotConfigured",
     "WhitelistResponse",
@@ -236,8 +239,10 @@ __all__ = [
     "generate_keypair",
     "generate_wallet",
     "get_config",
+    "install_uvloop",
     "load_evm_wallet",
     "load_wallet",
+    "load_wallet_bytes",
     "personal_sign",
     "raw_sign",
     "to_fuel_compact_signature",
@@ -38,6 +38,12 @@ from .models import (
 
 logger = logging.getLogger("o2_sdk.api")
 
+# aiohttp speaks HTTP/1.1 only, so concurrent calls each need a connection.
+# Keep idle ones (and their TLS state) around long enough to be reused across
+# bursts of calls, and skip re-resolving the API host on every new one.
+_KEEPALIVE_TIMEOUT = 60.0
+_DNS_CACHE_TTL = 300
+
 
 class O2Api:
     """Low-level REST API client for the O2 Exchange."""
@@ -49,7 +55,10 @@ class O2Api:
 
     async def _ensure_session(self) -> aiohttp.ClientSession:
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            connector = aiohttp.TCPConnector(
+                keepalive_timeout=_KEEPALIVE_TIMEOUT, ttl_dns_cache=_DNS_CACHE_TTL
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
             self._owns_session = True
         return self._session
 
@@ -1015,7 +1015,11 @@ class O2Client:
             yield event
 
     async def stream_depth(
-        self, market: str | Market, precision: int = 1
+        self,
+        market: str | Market,
+        precision: int = 1,
+        *,
+        ready: asyncio.Event | None = None,
     ) -> AsyncIterator[DepthUpdate]:
         """Stream order book depth updates.
 
@@ -1025,6 +1029,9 @@ class O2Client:
                 (most grouped). Default ``1``.  At level 1, prices are at or
                 near their exact values.  Higher levels round prices into larger
                 buckets.  Same scale as :meth:`get_depth`.
+            ready: Optional event, set once the subscription has been sent and
+                updates are being collected. Await it instead of sleeping
+                before triggering activity the stream should observe.
 
         Raises:
             InvalidRequest: If *precision* is outside the valid range 1--18.
@@ -1033,38 +1040,50 @@ class O2Client:
         wire_precision = str(10 ** int(precision))
         market_obj = await self._resolve_market_like_async(market)
         ws = await self._ensure_ws()
-        async for update in ws.stream_depth(market_obj.market_id, wire_precision):
+        async for update in ws.stream_depth(market_obj.market_id, wire_precision, ready=ready):
             yield update
 
-    async def stream_orders(self, account: AccountInfo | str) -> AsyncIterator[OrderUpdate]:
-        """Stream order updates for an account."""
+    async def stream_orders(
+        self, account: AccountInfo | str, *, ready: asyncio.Event | None = None
+    ) -> AsyncIterator[OrderUpdate]:
+        """Stream order updates for an account.
+
+        If *ready* is given it is set once the subscription has been sent, so
+        a caller can await it before placing the orders it wants to observe.
+        """
         trade_account_id = account if isinstance(account, str) else account.trade_account_id
         ws = await self._ensure_ws()
         identities = [{"ContractId": trade_account_id}]
-        async for update in ws.stream_orders(identities):
+        async for update in ws.stream_orders(identities, ready=ready):
             yield update
 
-    async def stream_trades(self, market: str | Market) -> AsyncIterator[TradeUpdate]:
+    async def stream_trades(
+        self, market: str | Market, *, ready: asyncio.Event | None = None
+    ) -> AsyncIterator[TradeUpdate]:
         """Stream trade updates for a market."""
         market_obj = await self._resolve_market_like_async(market)
         ws = await self._ensure_ws()
-        async for update in ws.stream_trades(market_obj.market_id):
+        async for update in ws.stream_trades(market_obj.market_id, ready=ready):
             yield update
 
-    async def stream_balances(self, account: AccountInfo | str) -> AsyncIterator[BalanceUpdate]:
+    async def stream_balances(
+        self, account: AccountInfo | str, *, ready: asyncio.Event | None = None
+    ) -> AsyncIterator[BalanceUpdate]:
         """Stream balance updates for an account."""
         trade_account_id = account if isinstance(account, str) else account.trade_account_id
         ws = await self._ensure_ws()
         identities = [{"ContractId": trade_account_id}]
-        async for update in ws.stream_balances(identities):
+        async for update in ws.stream_balances(identities, ready=ready):
             yield update
 
-    async def stream_nonce(self, account: AccountInfo | str) -> AsyncIterator[NonceUpdate]:
+    async def stream_nonce(
+        self, account: AccountInfo | str, *, ready: asyncio.Event | None = None
+    ) -> AsyncIterator[NonceUpdate]:
         """Stream nonce updates for an account."""
         trade_account_id = account if isinstance(account, str) else account.trade_account_id
         ws = await self._ensure_ws()
         identities = [{"ContractId": trade_account_id}]
-        async for update in ws.stream_nonce(identities):
+        async for update in ws.stream_nonce(identities, ready=ready):
             yield update
 
     # -----------------------------------------------------------------------
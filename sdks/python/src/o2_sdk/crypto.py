@@ -11,11 +11,12 @@ Implements:
 
 from __future__ import annotations
 
-import hashlib
 import logging
 import os
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import cached_property
+from hashlib import sha256 as _hashlib_sha256
 from typing import Protocol, runtime_checkable
 
 from coincurve import PrivateKey
@@ -23,6 +24,12 @@ from Crypto.Hash import keccak
 
 logger = logging.getLogger("o2_sdk.crypto")
 
+
+def _sha256(data: bytes | memoryview) -> bytes:
+    """Single-shot SHA-256 digest, the hash behind Fuel addresses and signatures."""
+    return _hashlib_sha256(data).digest()
+
+
 # ---------------------------------------------------------------------------
 # Types
 # ---------------------------------------------------------------------------
@@ -82,8 +89,26 @@ class Signer(Protocol):
 # ---------------------------------------------------------------------------
 
 
+class _SigningKeyCache:
+    """Caches the parsed ``PrivateKey`` for ``private_key``, outside copy/pickle state.
+
+    coincurve keys cannot be pickled, so copies rebuild theirs on first use.
+    """
+
+    private_key: bytes
+
+    @cached_property
+    def _signing_key(self) -> PrivateKey:
+        return PrivateKey(self.private_key)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state.pop("_signing_key", None)
+        return state
+
+
 @dataclass
-class Wallet:
+class Wallet(_SigningKeyCache):
     """A Fuel-native wallet.
 
     Satisfies the :class:`Signer` protocol.
@@ -103,11 +128,11 @@ class Wallet:
         logger.debug(
             "Wallet.personal_sign: payload=%d bytes, digest=%s", len(message), digest.hex()
         )
-        return fuel_compact_sign(self.private_key, digest)
+        return _sign_with_pk(self._signing_key, digest)
 
 
 @dataclass
-class EvmWallet:
+class EvmWallet(_SigningKeyCache):
     """An EVM-compatible wallet with B256 zero-padded address.
 
     Satisfies the :class:`Signer` protocol.
@@ -128,7 +153,7 @@ class EvmWallet:
         logger.debug(
             "EvmWallet.personal_sign: payload=%d bytes, digest=%s", len(message), digest.hex()
         )
-        return fuel_compact_sign(self.private_key, digest)
+        return _sign_with_pk(self._signing_key, digest)
 
 
 def generate_keypair() -> tuple[str, bytes, str]:
@@ -139,7 +164,7 @@ def generate_keypair() -> tuple[str, bytes, str]:
     secret = os.urandom(32)
     pk = PrivateKey(secret)
     public_key = pk.public_key.format(compressed=False)  # 65 bytes
-    address = hashlib.sha256(public_key[1:]).digest()
+    address = _sha256(memoryview(public_key)[1:])
     return secret.hex(), public_key, "0x" + address.hex()
 
 
@@ -148,7 +173,7 @@ def generate_wallet() -> Wallet:
     secret = os.urandom(32)
     pk = PrivateKey(secret)
     public_key = pk.public_key.format(compressed=False)
-    address = hashlib.sha256(public_key[1:]).digest()
+    address = _sha256(memoryview(public_key)[1:])
     return Wallet(
         private_key=secret,
         public_key=public_key,
@@ -190,10 +215,14 @@ def generate_evm_wallet() -> EvmWallet:
 
 def load_wallet(private_key_hex: str) -> Wallet:
     """Load a Fuel-native wallet from a private key hex string."""
-    secret = bytes.fromhex(private_key_hex.removeprefix("0x"))
+    return load_wallet_bytes(bytes.fromhex(private_key_hex.removeprefix("0x")))
+
+
+def load_wallet_bytes(secret: bytes) -> Wallet:
+    """Load a Fuel-native wallet from a raw 32-byte private key."""
     pk = PrivateKey(secret)
     public_key = pk.public_key.format(compressed=False)
-    address = hashlib.sha256(public_key[1:]).digest()
+    address = _sha256(memoryview(public_key)[1:])
     return Wallet(
         private_key=secret,
         public_key=public_key,
@@ -229,17 +258,25 @@ def fuel_compact_sign(private_key_bytes: bytes, digest: bytes) -> bytes:
       3. Embed recovery_id in MSB of s[0]: s[0] = (recovery_id << 7) | (s[0] & 0x7F)
       4. Return r(32) + s(32) = 64 bytes
     """
-    pk = PrivateKey(private_key_bytes)
+    return _sign_with_pk(PrivateKey(private_key_bytes), digest)
+
+
+def _sign_with_pk(pk: PrivateKey, digest: bytes) -> bytes:
+    """:func:`fuel_compact_sign` for an already-constructed key.
+
+    Building a ``PrivateKey`` derives its public key, which costs about as
+    much as the signature itself; long-lived signers keep theirs.
+    """
     # sign_recoverable returns 65 bytes: [r(32)] [s(32)] [recovery_id(1)]
     sig = pk.sign_recoverable(digest, hasher=None)
-    r = sig[0:32]
-    s = bytearray(sig[32:64])
-    recovery_id = sig[64]
+    return _pack_compact(sig[:64], sig[64])
 
-    # Embed recovery ID in the MSB of s[0]
-    s[0] = (recovery_id << 7) | (s[0] & 0x7F)
 
-    return r + bytes(s)
+def _pack_compact(rs: bytes, recovery_id: int) -> bytes:
+    """Embed ``recovery_id`` in the MSB of s[0] of a 64-byte ``r || s`` signature."""
+    out = bytearray(rs)
+    out[32] = (recovery_id << 7) | (out[32] & 0x7F)
+    return bytes(out)
 
 
 def fuel_personal_sign_digest(message: bytes) -> bytes:
@@ -253,7 +290,7 @@ def fuel_personal_sign_digest(message: bytes) -> bytes:
     """
     prefix = b"\x19Fuel Signed Message:\n"
     length_str = str(len(message)).encode("utf-8")
-    return hashlib.sha256(prefix + length_str + message).digest()
+    return _sha256(prefix + length_str + message)
 
 
 def evm_personal_sign_digest(message: bytes) -> bytes:
@@ -287,7 +324,7 @@ def raw_sign(private_key_bytes: bytes, message_bytes: bytes) -> bytes:
 
     digest = sha256(message_bytes)
     """
-    digest = hashlib.sha256(message_bytes).digest()
+    digest = _sha256(message_bytes)
     logger.debug("raw_sign: payload=%d bytes, digest=%s", len(message_bytes), digest.hex())
     return fuel_compact_sign(private_key_bytes, digest)
 
@@ -339,9 +376,7 @@ def to_fuel_compact_signature(r: bytes, s: bytes, recovery_id: int) -> bytes:
     if recovery_id not in (0, 1):
         raise ValueError(f"recovery_id must be 0 or 1, got {recovery_id}")
 
-    s_modified = bytearray(s)
-    s_modified[0] = (recovery_id << 7) | (s_modified[0] & 0x7F)
-    return r + bytes(s_modified)
+    return _pack_compact(r + s, recovery_id)
 
 
 class ExternalSigner:
@@ -14,15 +14,24 @@ Implements the exact byte layouts from the O2 integration guide:
 from __future__ import annotations
 
 import struct
+from functools import lru_cache
 
 GAS_MAX = 18446744073709551615  # u64::MAX
 
+_U64_BE = struct.Struct(">Q")
+
 
 def u64_be(value: int) -> bytes:
     """Encode an integer as 8 bytes big-endian (u64)."""
-    return struct.pack(">Q", value)
+    return _U64_BE.pack(value)
+
 
+def _as_int(value: int | str) -> int:
+    """Return ``value`` as an int, parsing only when it arrives as a decimal string."""
+    return int(value, 10) if isinstance(value, str) else int(value)
 
+
+@lru_cache(maxsize=32)
 def function_selector(name: str) -> bytes:
     """Encode a Fuel ABI function selector: u64_be(len(name)) + utf8(name).
 
@@ -63,6 +72,37 @@ def encode_option_call_data(data_or_none: bytes | None) -> bytes:
     return u64_be(1) + u64_be(len(data_or_none)) + data_or_none
 
 
+# In-place writers for the builders below: they append straight onto the
+# caller's buffer instead of allocating an intermediate encoding. Addresses
+# are written as given; use ``encode_identity`` when the length needs checking.
+def _write_identity(buf: bytearray, discriminant: int, address_bytes: bytes) -> None:
+    buf += u64_be(discriminant)
+    buf += address_bytes
+
+
+def _write_option_call_data(buf: bytearray, data_or_none: bytes | None) -> None:
+    if data_or_none is None:
+        buf += u64_be(0)
+        return
+    buf += u64_be(1)
+    buf += u64_be(len(data_or_none))
+    buf += data_or_none
+
+
+# OrderType variant tags, pre-encoded as u64.
+_ORDER_TYPE_TAGS = {
+    name: u64_be(tag)
+    for name, tag in {
+        "Limit": 0,
+        "Spot": 1,
+        "FillOrKill": 2,
+        "PostOnly": 3,
+        "Market": 4,
+        "BoundedMarket": 5,
+    }.items()
+}
+
+
 def encode_order_args(
     price: int,
     quantity: int,
@@ -81,32 +121,25 @@ def encode_order_args(
       Market(4):        u64(4)                                  [8 bytes]
       BoundedMarket(5): u64(5) + u64(max_price) + u64(min_price) [24 bytes]
     """
+    tag = _ORDER_TYPE_TAGS.get(order_type)
+    if tag is None:
+        raise ValueError(f"Unknown order type: {order_type}")
+
     result = bytearray()
     result += u64_be(price)
     result += u64_be(quantity)
+    result += tag
 
     if order_type == "Limit":
         if order_type_data is None:
             raise ValueError("Limit order requires order_type_data")
-        limit_price = int(order_type_data["price"])
-        timestamp = int(order_type_data["timestamp"])
-        result += u64_be(0) + u64_be(limit_price) + u64_be(timestamp)
-    elif order_type == "Spot":
-        result += u64_be(1)
-    elif order_type == "FillOrKill":
-        result += u64_be(2)
-    elif order_type == "PostOnly":
-        result += u64_be(3)
-    elif order_type == "Market":
-        result += u64_be(4)
+        result += u64_be(_as_int(order_type_data["price"]))
+        result += u64_be(_as_int(order_type_data["timestamp"]))
     elif order_type == "BoundedMarket":
         if order_type_data is None:
             raise ValueError("BoundedMarket order requires order_type_data")
-        max_price = int(order_type_data["max_price"])
-        min_price = int(order_type_data["min_price"])
-        result += u64_be(5) + u64_be(max_price) + u64_be(min_price)
-    else:
-        raise ValueError(f"Unknown order type: {order_type}")
+        result += u64_be(_as_int(order_type_data["max_price"]))
+        result += u64_be(_as_int(order_type_data["min_price"]))
 
     return bytes(result)
 
@@ -131,21 +164,18 @@ def build_session_signing_bytes(
     """
     func_name = b"set_session"
 
-    encoded_args = bytearray()
-    encoded_args += u64_be(1)  # Option::Some
-    encoded_args += u64_be(0)  # Identity::Address
-    encoded_args += session_address  # 32 bytes
-    encoded_args += u64_be(expiry)  # expiry
-    encoded_args += u64_be(len(contract_ids))  # number of contract IDs
-    for cid in contract_ids:
-        encoded_args += cid  # 32 bytes each
-
     signing_bytes = bytearray()
     signing_bytes += u64_be(nonce)
     signing_bytes += u64_be(chain_id)
     signing_bytes += u64_be(len(func_name))
     signing_bytes += func_name
-    signing_bytes += encoded_args
+    # encoded args
+    signing_bytes += u64_be(1)  # Option::Some
+    _write_identity(signing_bytes, 0, session_address)  # Identity::Address
+    signing_bytes += u64_be(expiry)  # expiry
+    signing_bytes += u64_be(len(contract_ids))  # number of contract IDs
+    for cid in contract_ids:
+        signing_bytes += cid  # 32 bytes each
 
     return bytes(signing_bytes)
 
@@ -176,7 +206,7 @@ def build_actions_signing_bytes(nonce: int, calls: list[dict]) -> bytes:
         result += u64_be(call["amount"])  # 8 bytes
         result += call["asset_id"]  # 32 bytes
         result += u64_be(call["gas"])  # 8 bytes
-        result += encode_option_call_data(call.get("call_data"))
+        _write_option_call_data(result, call.get("call_data"))
 
     return bytes(result)
 
@@ -203,9 +233,7 @@ def build_withdraw_signing_bytes(
     result += u64_be(chain_id)
     result += u64_be(len(func_name))
     result += func_name
-    # to identity
-    result += u64_be(to_discriminant)
-    result += to_address
+    _write_identity(result, to_discriminant, to_address)
     # asset_id
     result += asset_id
     # amount
@@ -217,6 +245,8 @@ def build_withdraw_signing_bytes(
 def action_to_call(action: dict, market_info: dict) -> dict:
     """Convert a high-level action to a low-level contract call.
 
+    Numeric fields may be ints or decimal strings; ints are used as-is.
+
     Returns dict with: contract_id, function_selector, amount, asset_id, gas, call_data
     """
     contract_id = bytes.fromhex(market_info["contract_id"][2:])
@@ -224,8 +254,8 @@ def action_to_call(action: dict, market_info: dict) -> dict:
 
     if "CreateOrder" in action:
         data = action["CreateOrder"]
-        price = int(data["price"])
-        quantity = int(data["quantity"])
+        price = _as_int(data["price"])
+        quantity = _as_int(data["quantity"])
         side = data["side"]
         base_decimals = market_info["base"]["decimals"]
 
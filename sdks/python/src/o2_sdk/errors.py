@@ -222,6 +222,23 @@ class OnChainRevert(O2Error):
         return f"On-chain revert: {self.message}"
 
 
+class TraderNotWhitelisted(OnChainRevert):
+    """On-chain revert: the trading account is not whitelisted.
+
+    Raised for ``OrderCreationError::TraderNotWhiteListed`` and
+    ``WhitelistError::TraderNotWhitelisted``. Whitelist the account and retry.
+    """
+
+    pass
+
+
+# Decoded revert variants that get their own OnChainRevert subclass.
+REVERT_VARIANT_MAP: dict[str, type[OnChainRevert]] = {
+    "TraderNotWhiteListed": TraderNotWhitelisted,
+    "TraderNotWhitelisted": TraderNotWhitelisted,
+}
+
+
 ERROR_CODE_MAP: dict[int, type[O2Error]] = {
     1000: InternalError,
     1001: InvalidRequest,
@@ -287,6 +304,9 @@ def raise_for_error(data: dict[str, Any]) -> None:
             from .onchain_revert import augment_revert_reason
 
             augmented_reason = augment_revert_reason(message, reason, receipts)
-            raise OnChainRevert(message=message, reason=augmented_reason, receipts=receipts)
+            # Decoded reasons read "Enum::Variant \u2014 description".
+            variant = augmented_reason.partition(" \u2014 ")[0].rpartition("::")[2]
+            error_cls = REVERT_VARIANT_MAP.get(variant, OnChainRevert)
+            raise error_cls(message=message, reason=augmented_reason, receipts=receipts)
 
         raise O2Error(message=message)
@@ -16,7 +16,8 @@ import contextlib
 import enum
 import json
 import logging
-from collections.abc import AsyncIterator
+from collections import deque
+from collections.abc import AsyncIterator, Callable
 from dataclasses import dataclass
 from typing import Any
 
@@ -34,6 +35,134 @@ from .models import (
 
 logger = logging.getLogger("o2_sdk.websocket")
 
+# Inbound ``action`` field -> subscriber queue key.  Keep it a flat dict
+# rather than a branch chain; ``_ACTION_ROUTES`` below is derived from it.
+_ACTION_MAP: dict[str, str] = {
+    "subscribe_depth": "depth",
+    "subscribe_depth_update": "depth",
+    "subscribe_orders": "orders",
+    "subscribe_trades": "trades",
+    "subscribe_balances": "balances",
+    "subscribe_nonce": "nonce",
+}
+
+# Quoted action values that ``_dispatch`` can route.  Frames containing none
+# of them are discarded by a substring scan in ``_listen`` without being
+# JSON-decoded.  Quoting keeps "subscribe_depth" from matching inside
+# "subscribe_depth_update".
+_ROUTED_ACTION_TOKENS: tuple[str, ...] = tuple(f'"{action}"' for action in _ACTION_MAP)
+_ROUTED_ACTION_TOKENS_BYTES: tuple[bytes, ...] = tuple(
+    token.encode() for token in _ROUTED_ACTION_TOKENS
+)
+
+# ``unsubscribe_orders`` takes no parameters, so its frame is encoded once.
+_UNSUBSCRIBE_ORDERS: dict[str, str] = {"action": "unsubscribe_orders"}
+_UNSUBSCRIBE_ORDERS_FRAME = json.dumps(_UNSUBSCRIBE_ORDERS)
+
+# Queue key -> model constructor.  Each inbound message is converted once in
+# ``_dispatch`` and the typed object is fanned out to every subscriber.
+_MODEL_MAP: dict[str, Callable[[dict], Any]] = {
+    "depth": DepthUpdate.from_dict,
+    "orders": OrderUpdate.from_dict,
+    "trades": TradeUpdate.from_dict,
+    "balances": BalanceUpdate.from_dict,
+    "nonce": NonceUpdate.from_dict,
+}
+
+# Inbound ``action`` -> (queue key, model constructor), fused from the two
+# tables above so ``_dispatch`` resolves both with a single lookup.
+_ACTION_ROUTES: dict[str, tuple[str, Callable[[dict], Any]]] = {
+    action: (key, _MODEL_MAP[key]) for action, key in _ACTION_MAP.items()
+}
+
+# ``recv()`` returns without suspending while frames are already buffered, so
+# under a burst the listener yields to the event loop every this many messages
+# to let stream consumers drain their channels.  Must be a power of two.
+_LISTEN_YIELD_EVERY = 64
+
+# Frames at least this large (e.g. full depth snapshots) are decoded in the
+# default thread pool so a long parse does not stall every other coroutine.
+# Smaller frames decode faster than an executor round trip.
+_OFFLOAD_PARSE_SIZE = 64 * 1024
+
+
+def _is_routable(raw: str | bytes) -> bool:
+    """Cheap pre-parse check: could ``raw`` carry an action we dispatch?"""
+    if isinstance(raw, bytes):
+        return any(token in raw for token in _ROUTED_ACTION_TOKENS_BYTES)
+    return any(token in raw for token in _ROUTED_ACTION_TOKENS)
+
+
+def _shard_key(market_id: str | None) -> str | None:
+    """Normalise a market ID for use as a subscriber-channel discriminator."""
+    if not market_id:
+        return None
+    return market_id.lower().removeprefix("0x")
+
+
+class _SubscriberChannel:
+    """Bounded single-consumer buffer between the listener and one stream.
+
+    The listener pushes without ever blocking; once ``maxlen`` messages are
+    buffered the oldest is discarded.  The consumer iterates with
+    ``async for`` and stops once the channel is closed and drained, so
+    anything pushed before ``close()`` (e.g. the terminal CLOSED lifecycle
+    event) is still delivered.
+    """
+
+    __slots__ = ("_buf", "_closed", "_ready")
+
+    def __init__(self, maxlen: int = 1000) -> None:
+        self._buf: deque[Any] = deque(maxlen=maxlen)
+        self._ready = asyncio.Event()
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._buf)
+
+    @property
+    def full(self) -> bool:
+        return len(self._buf) == self._buf.maxlen
+
+    def push(self, item: Any) -> None:
+        self._buf.append(item)
+        self._ready.set()
+
+    def clear(self) -> None:
+        self._buf.clear()
+
+    def close(self) -> None:
+        self._closed = True
+        self._ready.set()
+
+    def __aiter__(self) -> _SubscriberChannel:
+        return self
+
+    async def __anext__(self) -> Any:
+        while not self._buf:
+            if self._closed:
+                raise StopAsyncIteration
+            self._ready.clear()
+            await self._ready.wait()
+        return self._buf.popleft()
+
+
+def install_uvloop() -> bool:
+    """Use uvloop for event loops created after this call, if it is installed.
+
+    The WebSocket listener spends most of its time in socket reads and
+    callback scheduling, both of which are cheaper under uvloop.  Call this
+    before ``asyncio.run()``.  uvloop is optional (``pip install
+    "o2-sdk[uvloop]"``); returns ``False`` and leaves the default event loop
+    policy unchanged when it is not available.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
 
 # ---------------------------------------------------------------------------
 # Lifecycle events
@@ -71,11 +200,14 @@ class O2WebSocket:
     Features:
     - Auto-reconnect with exponential backoff
     - Subscription tracking and automatic re-subscribe on reconnect
-    - Per-subscriber message queues for safe concurrent access
+    - Per-subscriber message channels for safe concurrent access
     - Heartbeat ping/pong to detect silent disconnections
     - Lifecycle event channel for connection state awareness
     - Configurable max reconnect attempts
 
+    For high message rates, call :func:`install_uvloop` before starting the
+    event loop.
+
     Financial safety:
     After a reconnect the server replays the current order-book snapshot,
     but in-flight messages during the disconnect window are lost.  Callers
@@ -93,10 +225,14 @@ class O2WebSocket:
     ):
         self._config = config
         self._ws: ClientConnection | None = None
-        self._subscriptions: list[dict] = []
-        # Per-subscriber fan-out: each stream_*() call registers its own queue.
-        # Key = action queue key (e.g. "depth", "orders"), value = list of queues.
-        self._subscriber_queues: dict[str, list[asyncio.Queue[Any]]] = {}
+        # Tracked subscriptions grouped by (action, market_id), so each
+        # unsubscribe_*() drops its group in O(1).  A group maps the encoded
+        # frame to its message; reconnect re-sends the cached frames.
+        self._subscriptions: dict[tuple[str, str | None], dict[str, dict]] = {}
+        # Per-subscriber fan-out: each stream_*() call registers its own channel.
+        # Key = (action queue key, market shard), e.g. ("depth", "09c1...") or
+        # ("orders", None) for streams that are not market-scoped.
+        self._subscriber_channels: dict[tuple[str, str | None], list[_SubscriberChannel]] = {}
         self._listener_task: asyncio.Task | None = None
         self._ping_task: asyncio.Task | None = None
         self._connected = False
@@ -107,7 +243,8 @@ class O2WebSocket:
         self._pong_timeout = pong_timeout
         self._max_reconnect_attempts = max_reconnect_attempts
         self._reconnect_attempts = 0
-        self._close_event = asyncio.Event()
+        # Frames received so far; lets _ping_loop skip pings while data flows.
+        self._recv_seq = 0
 
     # ------------------------------------------------------------------
     # Connection lifecycle
@@ -116,7 +253,6 @@ class O2WebSocket:
     async def connect(self) -> O2WebSocket:
         """Connect to the WebSocket endpoint."""
         self._should_run = True
-        self._close_event.clear()
         self._reconnect_attempts = 0
         await self._do_connect()
         self._emit_lifecycle(ConnectionState.CONNECTED, message="Initial connection")
@@ -130,9 +266,15 @@ class O2WebSocket:
         self._reconnect_attempts = 0
         logger.info("WebSocket connected to %s", self._config.ws_url)
 
-        # Re-subscribe on reconnect
-        for sub in self._subscriptions:
-            await self._send(sub)
+        # Re-subscribe on reconnect.  The frames are sent concurrently so
+        # they go out in one event-loop pass instead of one await per frame.
+        tracked = [
+            (sub, payload)
+            for group in self._subscriptions.values()
+            for payload, sub in group.items()
+        ]
+        if tracked:
+            await asyncio.gather(*(self._send(sub, payload) for sub, payload in tracked))
 
     def _ensure_background_tasks(self) -> None:
         """Start listener and ping tasks if they are not already running."""
@@ -150,15 +292,22 @@ class O2WebSocket:
         ``stream_depth`` at precision 0 on a quiet market).  Reconnecting in
         that case would be incorrect — the connection is alive, there's just
         nothing to report.
+
+        The converse does hold, though: any frame received during an interval
+        proves the connection is alive, so the ping is skipped for that
+        interval and only idle connections pay for a ping round trip.
         """
         try:
             while self._should_run and self._connected:
+                seen = self._recv_seq
                 await asyncio.sleep(self._ping_interval)
                 if not self._should_run or not self._connected:
                     return
 
                 if not self._ws:
                     return
+                if self._recv_seq != seen:
+                    continue
 
                 try:
                     # ws.ping() returns a Future that resolves when the
@@ -200,12 +349,11 @@ class O2WebSocket:
                     self._max_reconnect_attempts,
                 )
                 self._should_run = False
-                self._close_event.set()
                 self._emit_lifecycle(
                     ConnectionState.CLOSED,
                     message=f"Max reconnect attempts ({self._max_reconnect_attempts}) exhausted",
                 )
-                self._signal_all_queues(None)
+                self._close_all_channels()
                 return
 
             self._reconnect_attempts += 1
@@ -247,9 +395,9 @@ class O2WebSocket:
         are unblocked as early as possible:
 
         1. Signal shutdown (``_should_run = False``)
-        2. Signal all subscriber queues *first* — unblocks any consumer
-           sitting in ``queue.get()`` before we attempt the (potentially
-           slow) WS close handshake.
+        2. Close all subscriber channels *first* — unblocks any consumer
+           waiting for a message before we attempt the (potentially slow)
+           WS close handshake.
         3. Cancel internal tasks with a timeout.
         4. Close the WS connection with a timeout — a broken TCP connection
            can hang for minutes without one.
@@ -258,13 +406,10 @@ class O2WebSocket:
         self._should_run = False
         self._connected = False
 
-        # Emit the terminal CLOSED event BEFORE setting _close_event, so
-        # stream_lifecycle() consumers see it before _wait_for_message()
-        # short-circuits them.  The close event + sentinel then unblock all
-        # generators (including lifecycle after it yields the CLOSED event).
+        # Emit the terminal CLOSED event BEFORE closing the channels, so
+        # stream_lifecycle() consumers drain it before their iteration ends.
         self._emit_lifecycle(ConnectionState.CLOSED, message="Disconnected by client")
-        self._close_event.set()
-        self._signal_all_queues(None)
+        self._close_all_channels()
 
         # Cancel internal tasks with a bounded wait.  If _reconnect() is
         # mid-backoff the cancel interrupts the sleep; the 5s timeout is
@@ -293,65 +438,19 @@ class O2WebSocket:
     # Internal message routing
     # ------------------------------------------------------------------
 
-    async def _wait_for_message(self, queue: asyncio.Queue[Any]) -> Any | None:
-        """Wait for the next queue message OR the close event, whichever first.
+    def _close_all_channels(self) -> None:
+        """Close every subscriber channel so consumer generators finish.
 
-        Returns the message, or ``None`` if the close event fired (shutdown)
-        AND no message was already queued.  When both are ready (e.g. the
-        lifecycle CLOSED event was pushed just before the close event was set),
-        the queued message wins so consumers don't miss terminal events.
+        Buffered data messages are stale once the connection is gone, so data
+        channels are cleared in one ``deque.clear()`` call rather than drained.
+        Lifecycle channels keep their buffer so the CLOSED event pushed just
+        before is still delivered.
         """
-        # Fast path: drain any already-queued message before checking close.
-        if not queue.empty():
-            return queue.get_nowait()
-        if self._close_event.is_set():
-            return None
-
-        get_task = asyncio.ensure_future(queue.get())
-        close_task = asyncio.ensure_future(self._close_event.wait())
-        try:
-            done, pending = await asyncio.wait(
-                [get_task, close_task],
-                return_when=asyncio.FIRST_COMPLETED,
-            )
-            for p in pending:
-                p.cancel()
-                with contextlib.suppress(asyncio.CancelledError):
-                    await p
-            # Prefer queued messages over close signal — ensures terminal
-            # events (like CLOSED) are delivered before the generator exits.
-            if get_task in done:
-                return get_task.result()
-            return None
-        except asyncio.CancelledError:
-            get_task.cancel()
-            close_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                _ = await get_task  # ensure task is finalized
-            with contextlib.suppress(asyncio.CancelledError):
-                _ = await close_task  # ensure task is finalized
-            raise
-
-    def _signal_all_queues(self, sentinel: object) -> None:
-        """Push a sentinel value to every subscriber queue.
-
-        Data-stream generators use ``_wait_for_message`` which races against
-        ``_close_event``, so the sentinel is belt-and-suspenders for them.
-        However ``stream_lifecycle`` uses raw ``queue.get()`` and **depends**
-        on the sentinel to exit.  If the queue is full we must make room —
-        dropping one stale event is acceptable to guarantee the sentinel
-        (and the CLOSED event before it) are delivered.
-        """
-        for queues in self._subscriber_queues.values():
-            for q in queues:
-                try:
-                    q.put_nowait(sentinel)
-                except asyncio.QueueFull:
-                    # Drop oldest item to make room for the sentinel.
-                    with contextlib.suppress(asyncio.QueueEmpty):
-                        q.get_nowait()
-                    with contextlib.suppress(asyncio.QueueFull):
-                        q.put_nowait(sentinel)
+        for (key, _shard), channels in self._subscriber_channels.items():
+            for ch in channels:
+                if key != "lifecycle":
+                    ch.clear()
+                ch.close()
 
     def _emit_lifecycle(
         self,
@@ -362,31 +461,26 @@ class O2WebSocket:
         """Push a lifecycle event to all lifecycle subscribers."""
         event = ConnectionEvent(state=state, attempt=attempt, message=message)
         logger.info("WS lifecycle: %s — %s", state.value, message)
-        if "lifecycle" in self._subscriber_queues:
-            for q in self._subscriber_queues["lifecycle"]:
-                try:
-                    q.put_nowait(event)
-                except asyncio.QueueFull:
-                    # Drain and retry — lifecycle events must not be lost
-                    while not q.empty():
-                        try:
-                            q.get_nowait()
-                        except asyncio.QueueEmpty:
-                            break
-                    q.put_nowait(event)
-
-    async def _send(self, message: dict) -> None:
+        # Pushing never fails: a full channel drops its oldest (stale) event.
+        for ch in self._subscriber_channels.get(("lifecycle", None), ()):
+            ch.push(event)
+
+    async def _send(self, message: dict, payload: str | None = None) -> None:
+        """Send ``message``, using ``payload`` as its pre-encoded frame if given."""
         if self._ws:
-            logger.debug("WS send: %s", message.get("action", message))
-            await self._ws.send(json.dumps(message))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("WS send: %s", message.get("action", message))
+            await self._ws.send(payload if payload is not None else json.dumps(message))
 
     async def _listen(self) -> None:
-        """Read messages from the WebSocket and dispatch to subscriber queues.
+        """Read messages from the WebSocket and dispatch to subscriber channels.
 
         On connection loss this method handles reconnection internally and
         continues reading — it does NOT return after a reconnect, which was
         the root cause of the "orphaned queue" hang in previous versions.
         """
+        received = 0
+        run_in_executor = asyncio.get_running_loop().run_in_executor
         try:
             while self._should_run:
                 if not self._ws or not self._connected:
@@ -394,9 +488,20 @@ class O2WebSocket:
                     continue
                 try:
                     raw = await self._ws.recv()
-                    data = json.loads(raw)
+                    self._recv_seq += 1
+                    if not _is_routable(raw):
+                        continue
+                    # Awaited in place so messages are still dispatched in
+                    # the order they were received.
+                    if len(raw) >= _OFFLOAD_PARSE_SIZE:
+                        data = await run_in_executor(None, json.loads, raw)
+                    else:
+                        data = json.loads(raw)
                     action = data.get("action", "")
                     self._dispatch(action, data)
+                    received += 1
+                    if received & (_LISTEN_YIELD_EVERY - 1) == 0:
+                        await asyncio.sleep(0)
                 except websockets.ConnectionClosed:
                     logger.warning("WebSocket connection closed")
                     if self._should_run:
@@ -418,56 +523,94 @@ class O2WebSocket:
             return
 
     def _dispatch(self, action: str, data: dict) -> None:
-        """Route messages to all subscriber queues for the matching action type."""
-        key = self._action_to_queue_key(action)
-        if key and key in self._subscriber_queues:
-            for q in self._subscriber_queues[key]:
-                try:
-                    q.put_nowait(data)
-                except asyncio.QueueFull:
-                    logger.warning("Subscriber queue full for %s, dropping message", key)
-            logger.debug(
-                "WS dispatched %s -> %d %s subscriber(s)",
-                action,
-                len(self._subscriber_queues[key]),
-                key,
-            )
-        elif key is None and action:
-            logger.warning("WS unhandled action: %s", action)
-
-    def _action_to_queue_key(self, action: str) -> str | None:
-        if action in ("subscribe_depth", "subscribe_depth_update"):
-            return "depth"
-        elif action == "subscribe_orders":
-            return "orders"
-        elif action == "subscribe_trades":
-            return "trades"
-        elif action == "subscribe_balances":
-            return "balances"
-        elif action == "subscribe_nonce":
-            return "nonce"
-        return None
+        """Route messages to the subscriber channels for the matching action type.
+
+        Market-scoped streams (depth, trades) register under their market
+        shard, so a message is only fanned out to channels for its own market
+        plus any unscoped subscribers.  The raw message is converted to its
+        typed model once, here, and the same object is pushed to every channel.
+        """
+        route = _ACTION_ROUTES.get(action)
+        if route is None:
+            if action:
+                logger.warning("WS unhandled action: %s", action)
+            return
+        key, build = route
+
+        channels = self._subscriber_channels
+        unscoped = channels.get((key, None))
+        shard = _shard_key(data.get("market_id"))
+        scoped = channels.get((key, shard)) if shard is not None else None
+        # Only allocate a merged list when both buckets have subscribers;
+        # otherwise iterate the registered list directly.
+        targets = unscoped + scoped if unscoped and scoped else unscoped or scoped
+        if not targets:
+            return
+
+        try:
+            update = build(data)
+        except Exception as e:
+            logger.warning("WS dropping malformed %s message: %s", action, e)
+            return
+        if len(targets) == 1:
+            # Fast path: a single subscriber is the common case.
+            ch = targets[0]
+            if ch.full:
+                logger.warning("Subscriber channel full for %s, dropping oldest message", key)
+            ch.push(update)
+        else:
+            for ch in targets:
+                if ch.full:
+                    logger.warning("Subscriber channel full for %s, dropping oldest message", key)
+                ch.push(update)
+        # Guarded so the argument list is not built per message when DEBUG is
+        # off; isEnabledFor() is cached by logging and honours config changes.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("WS dispatched %s -> %d %s subscriber(s)", action, len(targets), key)
+
+    def _register_channel(self, key: str, market_id: str | None = None) -> _SubscriberChannel:
+        """Create and register a new subscriber channel for the given action key.
+
+        Pass ``market_id`` to receive only that market's messages; without it
+        the channel receives every message routed to ``key``.  A channel
+        registered while the client is not running starts closed, so the
+        stream ends immediately instead of waiting forever.
+        """
+        ch = _SubscriberChannel(maxlen=1000)
+        if not self._should_run:
+            ch.close()
+        self._subscriber_channels.setdefault((key, _shard_key(market_id)), []).append(ch)
+        return ch
+
+    def _unregister_channel(
+        self, key: str, ch: _SubscriberChannel, market_id: str | None = None
+    ) -> None:
+        """Remove a subscriber channel when the consumer exits.
 
-    def _register_queue(self, key: str) -> asyncio.Queue[Any]:
-        """Create and register a new subscriber queue for the given action key."""
-        q: asyncio.Queue[Any] = asyncio.Queue(maxsize=1000)
-        if key not in self._subscriber_queues:
-            self._subscriber_queues[key] = []
-        self._subscriber_queues[key].append(q)
-        return q
-
-    def _unregister_queue(self, key: str, q: asyncio.Queue) -> None:
-        """Remove a subscriber queue when the consumer exits."""
-        if key in self._subscriber_queues:
+        The channel's buffer is cleared as well, so messages the consumer
+        never read are released immediately rather than when the generator
+        frame that still references the channel is collected.
+        """
+        ch.clear()
+        bucket_key = (key, _shard_key(market_id))
+        channels = self._subscriber_channels.get(bucket_key)
+        if channels is not None:
             with contextlib.suppress(ValueError):
-                self._subscriber_queues[key].remove(q)
-            if not self._subscriber_queues[key]:
-                del self._subscriber_queues[key]
+                channels.remove(ch)
+            if not channels:
+                del self._subscriber_channels[bucket_key]
 
-    def _add_subscription(self, sub: dict) -> None:
-        """Add a subscription for reconnect tracking, deduplicating by content."""
-        if sub not in self._subscriptions:
-            self._subscriptions.append(sub)
+    def _add_subscription(self, sub: dict) -> str:
+        """Add a subscription for reconnect tracking, deduplicating by content.
+
+        Returns the encoded frame for ``sub``, which is also its key within
+        the ``(action, market_id)`` group.
+        """
+        # Sorted keys make the frame a canonical key for the subscription.
+        payload = json.dumps(sub, sort_keys=True)
+        group = self._subscriptions.setdefault((sub["action"], sub.get("market_id")), {})
+        group.setdefault(payload, sub)
+        return payload
 
     # ------------------------------------------------------------------
     # Subscription methods
@@ -490,23 +633,21 @@ class O2WebSocket:
                 elif event.state == ConnectionState.CLOSED:
                     break  # terminal, no more events
         """
-        queue = self._register_queue("lifecycle")
+        channel = self._register_channel("lifecycle")
         try:
-            while self._should_run:
-                # Lifecycle uses raw queue.get() (not _wait_for_message)
-                # because it must receive the terminal CLOSED event before
-                # exiting.  The CLOSED event is pushed to the queue before
-                # _close_event is set, and _signal_all_queues(None) follows
-                # as the final sentinel.
-                msg = await queue.get()
-                if msg is None:
-                    return
-                yield msg
+            # The terminal CLOSED event is pushed before the channel is
+            # closed, so it is always yielded before iteration ends.
+            async for event in channel:
+                yield event
         finally:
-            self._unregister_queue("lifecycle", queue)
+            self._unregister_channel("lifecycle", channel)
 
     async def stream_depth(
-        self, market_id: str, wire_precision: str = "10"
+        self,
+        market_id: str,
+        wire_precision: str = "10",
+        *,
+        ready: asyncio.Event | None = None,
     ) -> AsyncIterator[DepthUpdate]:
         """Subscribe to order book depth updates.
 
@@ -516,6 +657,8 @@ class O2WebSocket:
                 The caller (normally :meth:`O2Client.stream_depth`) converts
                 the user-facing 1--18 index to the wire value. Default ``"10"``
                 (finest level).
+            ready: Optional event, set once the subscription has been sent
+                and updates are being collected (see :meth:`stream_orders`).
 
         Note:
             Prefer :meth:`O2Client.stream_depth` which validates precision
@@ -526,79 +669,95 @@ class O2WebSocket:
             "market_id": market_id,
             "precision": wire_precision,
         }
-        self._add_subscription(sub)
-        await self._send(sub)
-        queue = self._register_queue("depth")
+        payload = self._add_subscription(sub)
+        channel = self._register_channel("depth", market_id)
         try:
-            while self._should_run:
-                msg = await self._wait_for_message(queue)
-                if msg is None:
+            await self._send(sub, payload)
+            if ready is not None:
+                ready.set()
+            async for msg in channel:
+                if not self._should_run:
                     return
-                if msg.get("market_id") == market_id:
-                    yield DepthUpdate.from_dict(msg)
+                yield msg
         finally:
-            self._unregister_queue("depth", queue)
+            self._unregister_channel("depth", channel, market_id)
+
+    async def stream_orders(
+        self, identities: list[dict], *, ready: asyncio.Event | None = None
+    ) -> AsyncIterator[OrderUpdate]:
+        """Subscribe to order updates for the given identities.
 
-    async def stream_orders(self, identities: list[dict]) -> AsyncIterator[OrderUpdate]:
-        """Subscribe to order updates for the given identities."""
+        If *ready* is given it is set once the subscribe frame has been sent
+        and the stream is registered, so a caller can wait on it instead of
+        sleeping before triggering the activity it wants to observe.
+        """
         sub = {"action": "subscribe_orders", "identities": identities}
-        self._add_subscription(sub)
-        await self._send(sub)
-        queue = self._register_queue("orders")
+        payload = self._add_subscription(sub)
+        channel = self._register_channel("orders")
         try:
-            while self._should_run:
-                msg = await self._wait_for_message(queue)
-                if msg is None:
+            await self._send(sub, payload)
+            if ready is not None:
+                ready.set()
+            async for msg in channel:
+                if not self._should_run:
                     return
-                yield OrderUpdate.from_dict(msg)
+                yield msg
         finally:
-            self._unregister_queue("orders", queue)
+            self._unregister_channel("orders", channel)
 
-    async def stream_trades(self, market_id: str) -> AsyncIterator[TradeUpdate]:
+    async def stream_trades(
+        self, market_id: str, *, ready: asyncio.Event | None = None
+    ) -> AsyncIterator[TradeUpdate]:
         """Subscribe to trade updates for the given market."""
         sub = {"action": "subscribe_trades", "market_id": market_id}
-        self._add_subscription(sub)
-        await self._send(sub)
-        queue = self._register_queue("trades")
+        payload = self._add_subscription(sub)
+        channel = self._register_channel("trades", market_id)
         try:
-            while self._should_run:
-                msg = await self._wait_for_message(queue)
-                if msg is None:
+            await self._send(sub, payload)
+            if ready is not None:
+                ready.set()
+            async for msg in channel:
+                if not self._should_run:
                     return
-                if msg.get("market_id") == market_id:
-                    yield TradeUpdate.from_dict(msg)
+                yield msg
         finally:
-            self._unregister_queue("trades", queue)
+            self._unregister_channel("trades", channel, market_id)
 
-    async def stream_balances(self, identities: list[dict]) -> AsyncIterator[BalanceUpdate]:
+    async def stream_balances(
+        self, identities: list[dict], *, ready: asyncio.Event | None = None
+    ) -> AsyncIterator[BalanceUpdate]:
         """Subscribe to balance updates for the given identities."""
         sub = {"action": "subscribe_balances", "identities": identities}
-        self._add_subscription(sub)
-        await self._send(sub)
-        queue = self._register_queue("balances")
+        payload = self._add_subscription(sub)
+        channel = self._register_channel("balances")
         try:
-            while self._should_run:
-                msg = await self._wait_for_message(queue)
-                if msg is None:
+            await self._send(sub, payload)
+            if ready is not None:
+                ready.set()
+            async for msg in channel:
+                if not self._should_run:
                     return
-                yield BalanceUpdate.from_dict(msg)
+                yield msg
         finally:
-            self._unregister_queue("balances", queue)
+            self._unregister_channel("balances", channel)
 
-    async def stream_nonce(self, identities: list[dict]) -> AsyncIterator[NonceUpdate]:
+    async def stream_nonce(
+        self, identities: list[dict], *, ready: asyncio.Event | None = None
+    ) -> AsyncIterator[NonceUpdate]:
         """Subscribe to nonce updates for the given identities."""
         sub = {"action": "subscribe_nonce", "identities": identities}
-        self._add_subscription(sub)
-        await self._send(sub)
-        queue = self._register_queue("nonce")
+        payload = self._add_subscription(sub)
+        channel = self._register_channel("nonce")
         try:
-            while self._should_run:
-                msg = await self._wait_for_message(queue)
-                if msg is None:
+            await self._send(sub, payload)
+            if ready is not None:
+                ready.set()
+            async for msg in channel:
+                if not self._should_run:
                     return
-                yield NonceUpdate.from_dict(msg)
+                yield msg
         finally:
-            self._unregister_queue("nonce", queue)
+            self._unregister_channel("nonce", channel)
 
     # ------------------------------------------------------------------
     # Unsubscribe methods
@@ -606,34 +765,20 @@ class O2WebSocket:
 
     async def unsubscribe_depth(self, market_id: str) -> None:
         await self._send({"action": "unsubscribe_depth", "market_id": market_id})
-        self._subscriptions = [
-            s
-            for s in self._subscriptions
-            if not (s.get("action") == "subscribe_depth" and s.get("market_id") == market_id)
-        ]
+        self._subscriptions.pop(("subscribe_depth", market_id), None)
 
     async def unsubscribe_orders(self) -> None:
-        await self._send({"action": "unsubscribe_orders"})
-        self._subscriptions = [
-            s for s in self._subscriptions if s.get("action") != "subscribe_orders"
-        ]
+        await self._send(_UNSUBSCRIBE_ORDERS, _UNSUBSCRIBE_ORDERS_FRAME)
+        self._subscriptions.pop(("subscribe_orders", None), None)
 
     async def unsubscribe_trades(self, market_id: str) -> None:
         await self._send({"action": "unsubscribe_trades", "market_id": market_id})
-        self._subscriptions = [
-            s
-            for s in self._subscriptions
-            if not (s.get("action") == "subscribe_trades" and s.get("market_id") == market_id)
-        ]
+        self._subscriptions.pop(("subscribe_trades", market_id), None)
 
     async def unsubscribe_balances(self, identities: list[dict]) -> None:
         await self._send({"action": "unsubscribe_balances", "identities": identities})
-        self._subscriptions = [
-            s for s in self._subscriptions if s.get("action") != "subscribe_balances"
-        ]
+        self._subscriptions.pop(("subscribe_balances", None), None)
 
     async def unsubscribe_nonce(self, identities: list[dict]) -> None:
         await self._send({"action": "unsubscribe_nonce", "identities": identities})
-        self._subscriptions = [
-            s for s in self._subscriptions if s.get("action") != "subscribe_nonce"
-        ]
+        self._subscriptions.pop(("subscribe_nonce", None), None)
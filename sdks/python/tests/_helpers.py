@@ -0,0 +1,31 @@
+"""Plain helpers shared by the unit tests and their fixtures in ``conftest``."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from o2_sdk import ActionsResponse, AddressIdentity, O2Client
+
+MARKET_ID = "0x09c17f779eb0a7658424e48935b2bef24013766f8b3da757becb2264406f9e96"
+SESSION_TRADE_ACCOUNT_ID = "0x" + "66" * 32
+# Parsed once; identities are never mutated, so every session stub can share it.
+SESSION_ID = AddressIdentity("0x" + "55" * 32)
+
+
+@dataclass
+class SigningCapture:
+    """Stands in for ``client.api`` and records what ``submit_actions`` received."""
+
+    response: ActionsResponse | None = None
+    owner: str | None = None
+    request: dict = field(default_factory=dict)
+
+    def install_submit(self, client: O2Client, response: ActionsResponse) -> None:
+        """Swap in this capture as ``client.api``, answering ``submit_actions`` with ``response``."""
+        self.response = response
+        client.api = self  # type: ignore[assignment]
+
+    async def submit_actions(self, owner: str, request: dict) -> ActionsResponse | None:
+        self.owner = owner
+        self.request = request
+        return self.response
@@ -0,0 +1,136 @@
+"""Shared fixtures for the offline unit tests."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from functools import lru_cache
+from unittest.mock import MagicMock
+
+import pytest
+
+import o2_sdk.crypto
+from o2_sdk import (
+    AccountInfo,
+    Market,
+    MarketsResponse,
+    O2Client,
+    SessionInfo,
+    Wallet,
+    load_wallet,
+)
+
+from ._helpers import MARKET_ID, SESSION_ID, SESSION_TRADE_ACCOUNT_ID, SigningCapture
+
+_MARKET_PAYLOAD = {
+    "contract_id": "0x9ad52fb8a2be1c4603dfeeb8118a922c8cfafa8f260eeb41d68ade8d442be65b",
+    "market_id": MARKET_ID,
+    "maker_fee": "0",
+    "taker_fee": "100",
+    "min_order": "1000",
+    "dust": "1000",
+    "price_window": 0,
+    "base": {
+        "symbol": "FUEL",
+        "asset": "0xa1b2c3d4e5f60000000000000000000000000000000000000000000000000000",
+        "decimals": 9,
+        "max_precision": 3,
+    },
+    "quote": {
+        "symbol": "USDC",
+        "asset": "0xf6e5d4c3b2a10000000000000000000000000000000000000000000000000000",
+        "decimals": 9,
+        "max_precision": 9,
+    },
+}
+
+_MARKETS_PAYLOAD = {
+    "books_registry_id": "0x" + "11" * 32,
+    "accounts_registry_id": "0x" + "22" * 32,
+    "trade_account_oracle_id": "0x" + "33" * 32,
+    "chain_id": "0x0000000000002699",
+    "base_asset_id": "0x" + "44" * 32,
+    "markets": [_MARKET_PAYLOAD],
+}
+
+# SessionInfo cannot be shared or frozen (O2Client advances ``nonce`` on it),
+# so the fixture builds a new one per test from these prebuilt field values.
+_SESSION_CONTRACT_ID = "0x" + "77" * 32
+_SESSION_OWNER_ADDRESS = "0x" + "88" * 32
+_SESSION_PRIVATE_KEY = b"\x01" * 32
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _memoized_compact_sign() -> Iterator[None]:
+    """Reuse signatures for repeated (key, digest) pairs within the run.
+
+    RFC 6979 makes them deterministic. Only the SDK's own callers
+    (``raw_sign``, ``personal_sign``, ...) see the cache; tests that import
+    ``fuel_compact_sign`` directly keep exercising libsecp256k1.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            o2_sdk.crypto,
+            "fuel_compact_sign",
+            lru_cache(maxsize=1024)(o2_sdk.crypto.fuel_compact_sign),
+        )
+        yield
+
+
+@pytest.fixture(scope="session")
+def markets_response() -> MarketsResponse:
+    # Parsed once per run; tests only read it.
+    return MarketsResponse.from_dict(_MARKETS_PAYLOAD)
+
+
+@pytest.fixture(scope="session")
+def market(markets_response: MarketsResponse) -> Market:
+    # The same instance the client resolves from its markets cache.
+    return markets_response.markets[0]
+
+
+@pytest.fixture(scope="session")
+def wallet() -> Wallet:
+    """A fixed-key owner wallet for tests that only need an identity to sign with."""
+    return load_wallet("0x" + "01" * 32)
+
+
+@pytest.fixture
+def session_info() -> SessionInfo:
+    return SessionInfo(
+        session_id=SESSION_ID,
+        trade_account_id=SESSION_TRADE_ACCOUNT_ID,
+        contract_ids=[_SESSION_CONTRACT_ID],
+        session_expiry="9999999999",
+        session_private_key=_SESSION_PRIVATE_KEY,
+        owner_address=_SESSION_OWNER_ADDRESS,
+        nonce=0,
+    )
+
+
+@pytest.fixture
+def account() -> MagicMock:
+    """An ``AccountInfo`` stand-in for stubbed ``get_account`` calls."""
+    # Built per test: copies of a shared mock would share its child mocks.
+    return MagicMock(spec=AccountInfo, exists=True, trade_account_id=None, nonce=0)
+
+
+@pytest.fixture
+def client(markets_response: MarketsResponse) -> O2Client:
+    """A fresh client whose markets cache is pre-populated (no network)."""
+    # Kept per-test: tests swap out ``api`` and advance nonce/session state, and
+    # construction is sub-microsecond since the HTTP session is opened lazily.
+    c = O2Client()
+    c._markets_cache = markets_response
+    return c
+
+
+@pytest.fixture
+def patched_signing(monkeypatch: pytest.MonkeyPatch) -> SigningCapture:
+    """Stub call encoding and signing so batch_actions needs no real keys."""
+    monkeypatch.setattr(
+        "o2_sdk.client.action_to_call",
+        lambda _action, _market_info: {"contract_id": b"", "asset_id": b"", "amount": 0},
+    )
+    monkeypatch.setattr("o2_sdk.client.build_actions_signing_bytes", lambda _nonce, _calls: b"x")
+    monkeypatch.setattr("o2_sdk.client.raw_sign", lambda _key, _payload: b"\x99" * 64)
+    return SigningCapture()
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
 import pytest
 
 from o2_sdk import (
@@ -9,265 +13,178 @@ from o2_sdk import (
     AddressIdentity,
     ChainInt,
     Market,
+    MarketActionGroup,
     MarketActions,
-    MarketsResponse,
+    MarketActionsBuilder,
     NetworkConfig,
     O2Client,
     O2Error,
     OrderSide,
     SessionInfo,
     SettleBalanceAction,
+    Wallet,
 )
 
+from ._helpers import MARKET_ID, SESSION_ID, SESSION_TRADE_ACCOUNT_ID, SigningCapture
 
-def _test_market() -> Market:
-    return Market.from_dict(
-        {
-            "contract_id": "0x9ad52fb8a2be1c4603dfeeb8118a922c8cfafa8f260eeb41d68ade8d442be65b",
-            "market_id": "0x09c17f779eb0a7658424e48935b2bef24013766f8b3da757becb2264406f9e96",
-            "maker_fee": "0",
-            "taker_fee": "100",
-            "min_order": "1000",
-            "dust": "1000",
-            "price_window": 0,
-            "base": {
-                "symbol": "FUEL",
-                "asset": "0xa1b2c3d4e5f60000000000000000000000000000000000000000000000000000",
-                "decimals": 9,
-                "max_precision": 3,
-            },
-            "quote": {
-                "symbol": "USDC",
-                "asset": "0xf6e5d4c3b2a10000000000000000000000000000000000000000000000000000",
-                "decimals": 9,
-                "max_precision": 9,
-            },
-        }
-    )
+# 32-byte hex IDs with every byte set to the same value, e.g. _HAA == "0xaaaa...aa".
+_H09 = "0x" + "09" * 32
+_H11 = "0x" + "11" * 32
+_H12 = "0x" + "12" * 32
+_H22 = "0x" + "22" * 32
+_H33 = "0x" + "33" * 32
+_HAA = "0x" + "aa" * 32
+_HEE = "0x" + "ee" * 32
+_HFF = "0x" + "ff" * 32
 
+# The client never mutates the submit response, so each stub returns a shared instance.
+_RESPONSE_AA = ActionsResponse.from_dict({"tx_id": _HAA})
+_RESPONSE_EE = ActionsResponse.from_dict({"tx_id": _HEE})
+_RESPONSE_FF = ActionsResponse.from_dict({"tx_id": _HFF})
 
-def _test_markets_response(market: Market) -> MarketsResponse:
-    return MarketsResponse.from_dict(
-        {
-            "books_registry_id": "0x" + "11" * 32,
-            "accounts_registry_id": "0x" + "22" * 32,
-            "trade_account_oracle_id": "0x" + "33" * 32,
-            "chain_id": "0x0000000000002699",
-            "base_asset_id": "0x" + "44" * 32,
-            "markets": [
-                {
-                    "contract_id": str(market.contract_id),
-                    "market_id": str(market.market_id),
-                    "maker_fee": market.maker_fee,
-                    "taker_fee": market.taker_fee,
-                    "min_order": market.min_order,
-                    "dust": market.dust,
-                    "price_window": market.price_window,
-                    "base": {
-                        "symbol": market.base.symbol,
-                        "asset": market.base.asset,
-                        "decimals": market.base.decimals,
-                        "max_precision": market.base.max_precision,
-                    },
-                    "quote": {
-                        "symbol": market.quote.symbol,
-                        "asset": market.quote.asset,
-                        "decimals": market.quote.decimals,
-                        "max_precision": market.quote.max_precision,
-                    },
-                }
-            ],
-        }
-    )
 
+@dataclass(slots=True)
+class _StubSession:
+    """The fields O2Client.create_session reads from the API's session response."""
 
-def _test_session() -> SessionInfo:
-    return SessionInfo(
-        session_id=AddressIdentity("0x" + "55" * 32),
-        trade_account_id="0x" + "66" * 32,
-        contract_ids=["0x" + "77" * 32],
-        session_expiry="9999999999",
-        session_private_key=b"\x01" * 32,
-        owner_address="0x" + "88" * 32,
-        nonce=0,
-    )
-
-
-@pytest.mark.asyncio
-async def test_batch_actions_normalizes_builder_group(monkeypatch: pytest.MonkeyPatch):
-    client = O2Client()
-    market = _test_market()
-    session = _test_session()
-    client._markets_cache = _test_markets_response(market)
-    client._nonce_cache[session.trade_account_id] = 7
-
-    monkeypatch.setattr(
-        "o2_sdk.client.action_to_call",
-        lambda _action, _market_info: {"contract_id": b"", "asset_id": b"", "amount": 0},
-    )
-    monkeypatch.setattr("o2_sdk.client.build_actions_signing_bytes", lambda _nonce, _calls: b"x")
-    monkeypatch.setattr("o2_sdk.client.raw_sign", lambda _key, _payload: b"\x99" * 64)
+    session_id: AddressIdentity
+    trade_account_id: str
+    contract_ids: list
+    session_expiry: str
 
-    captured: dict = {}
 
-    async def fake_submit_actions(owner: str, request: dict) -> ActionsResponse:
-        captured["owner"] = owner
-        captured["request"] = request
-        return ActionsResponse.from_dict({"tx_id": "0x" + "aa" * 32})
+# ---------------------------------------------------------------------------
+# batch_actions request shape
+#
+# Each case submits the batch for one input style and checks the per-market
+# "actions" entries of the submitted request; the shared test body covers
+# signing, nonce and session handling.
+# ---------------------------------------------------------------------------
 
-    monkeypatch.setattr(client.api, "submit_actions", fake_submit_actions)
 
+def _build_settle_create_cancel(market: Market) -> list[MarketActionGroup]:
     group = (
-        client.actions_for(market.pair)
+        MarketActionsBuilder(market.pair)
         .settle_balance()
         .create_order(OrderSide.BUY, "0.1", "5")
-        .cancel_order("0x" + "09" * 32)
+        .cancel_order(_H09)
         .build()
     )
+    return [group]
 
-    result = await client.batch_actions([group], collect_orders=True, session=session)
-    assert result.success
-    req = captured["request"]
-    assert captured["owner"] == session.owner_address
-    assert req["nonce"] == "7"
-    assert req["collect_orders"] is True
-    actions = req["actions"][0]["actions"]
-    assert "SettleBalance" in actions[0]
-    assert actions[1]["CreateOrder"]["price"] == "100000000"
-    assert actions[1]["CreateOrder"]["quantity"] == "5000000000"
-    assert actions[1]["CreateOrder"]["order_type"] == "Spot"
-    assert actions[2]["CancelOrder"]["order_id"] == "0x" + "09" * 32
-
-
-@pytest.mark.asyncio
-async def test_batch_actions_accepts_chain_int(monkeypatch: pytest.MonkeyPatch):
-    client = O2Client()
-    market = _test_market()
-    session = _test_session()
-    client._markets_cache = _test_markets_response(market)
-    client._nonce_cache[session.trade_account_id] = 3
-
-    monkeypatch.setattr(
-        "o2_sdk.client.action_to_call",
-        lambda _action, _market_info: {"contract_id": b"", "asset_id": b"", "amount": 0},
-    )
-    monkeypatch.setattr("o2_sdk.client.build_actions_signing_bytes", lambda _nonce, _calls: b"x")
-    monkeypatch.setattr("o2_sdk.client.raw_sign", lambda _key, _payload: b"\x99" * 64)
-
-    captured: dict = {}
 
-    async def fake_submit_actions(_owner: str, request: dict) -> ActionsResponse:
-        captured["request"] = request
-        return ActionsResponse.from_dict({"tx_id": "0x" + "bb" * 32})
+def _check_settle_create_cancel(req_actions: list):
+    settle, create, cancel = req_actions[0]["actions"]
+    create_order = create["CreateOrder"]
+    assert "SettleBalance" in settle
+    assert create_order["price"] == "100000000"
+    assert create_order["quantity"] == "5000000000"
+    assert create_order["order_type"] == "Spot"
+    assert cancel["CancelOrder"]["order_id"] == _H09
 
-    monkeypatch.setattr(client.api, "submit_actions", fake_submit_actions)
 
+def _build_chain_int_order(market: Market) -> list[MarketActionGroup]:
     group = (
-        client.actions_for(market)
+        MarketActionsBuilder(market)
         .create_order(OrderSide.SELL, ChainInt(200000000), ChainInt(6000000000))
         .build()
     )
+    return [group]
+
 
-    await client.batch_actions([group], session=session)
-    create_order = captured["request"]["actions"][0]["actions"][0]["CreateOrder"]
+def _check_chain_int_order(req_actions: list):
+    create_order = req_actions[0]["actions"][0]["CreateOrder"]
     assert create_order["price"] == "200000000"
     assert create_order["quantity"] == "6000000000"
 
 
-@pytest.mark.asyncio
-async def test_batch_actions_rejects_bad_chain_int_precision():
-    client = O2Client()
-    market = _test_market()
-    session = _test_session()
-    client._markets_cache = _test_markets_response(market)
-    client._nonce_cache[session.trade_account_id] = 1
-
-    group = (
-        client.actions_for(market)
-        .create_order(OrderSide.BUY, ChainInt(100000000), ChainInt(5000000001))
-        .build()
+def _build_low_and_high_level(market: Market) -> list[MarketActions | MarketActionGroup]:
+    low_level = MarketActions(
+        market_id=market.market_id,
+        actions=[SettleBalanceAction(to=SESSION_TRADE_ACCOUNT_ID)],
     )
+    high_level = MarketActionsBuilder(market.pair).create_order(OrderSide.BUY, "0.2", "6").build()
+    return [low_level, high_level]
 
-    with pytest.raises(O2Error, match="raw quantity precision"):
-        await client._normalize_market_actions(session, [group])
 
+def _check_low_and_high_level(req_actions: list):
+    low_level, high_level = req_actions
+    assert low_level["market_id"] == MARKET_ID
+    assert "SettleBalance" in low_level["actions"][0]
+    assert high_level["actions"][0]["CreateOrder"]["price"] == "200000000"
 
-@pytest.mark.asyncio
-async def test_batch_actions_mixed_low_and_high_level(monkeypatch: pytest.MonkeyPatch):
-    client = O2Client()
-    market = _test_market()
-    session = _test_session()
-    client._markets_cache = _test_markets_response(market)
-    client._nonce_cache[session.trade_account_id] = 9
-
-    monkeypatch.setattr(
-        "o2_sdk.client.action_to_call",
-        lambda _action, _market_info: {"contract_id": b"", "asset_id": b"", "amount": 0},
-    )
-    monkeypatch.setattr("o2_sdk.client.build_actions_signing_bytes", lambda _nonce, _calls: b"x")
-    monkeypatch.setattr("o2_sdk.client.raw_sign", lambda _key, _payload: b"\x99" * 64)
 
-    captured: dict = {}
+def _build_single_order(market: Market) -> list[MarketActionGroup]:
+    return [MarketActionsBuilder(market).create_order(OrderSide.BUY, "0.1", "1").build()]
 
-    async def fake_submit_actions(_owner: str, request: dict) -> ActionsResponse:
-        captured["request"] = request
-        return ActionsResponse.from_dict({"tx_id": "0x" + "cc" * 32})
 
-    monkeypatch.setattr(client.api, "submit_actions", fake_submit_actions)
+def _check_single_order(req_actions: list):
+    assert "CreateOrder" in req_actions[0]["actions"][0]
 
-    low_level = MarketActions(
-        market_id=market.market_id,
-        actions=[SettleBalanceAction(to=session.trade_account_id)],
-    )
-    high_level = client.actions_for(market.pair).create_order(OrderSide.BUY, "0.2", "6").build()
 
-    await client.batch_actions([low_level, high_level], session=session)
-    req_actions = captured["request"]["actions"]
-    assert len(req_actions) == 2
-    assert req_actions[0]["market_id"] == market.market_id
-    assert "SettleBalance" in req_actions[0]["actions"][0]
-    assert req_actions[1]["actions"][0]["CreateOrder"]["price"] == "200000000"
+# (build, check, use_active_session) per input style.
+_BATCH_CASES = [
+    (_build_settle_create_cancel, _check_settle_create_cancel, False),
+    (_build_chain_int_order, _check_chain_int_order, False),
+    (_build_low_and_high_level, _check_low_and_high_level, False),
+    (_build_single_order, _check_single_order, True),
+]
 
 
 @pytest.mark.asyncio
-async def test_batch_actions_uses_active_session(monkeypatch: pytest.MonkeyPatch):
-    client = O2Client()
-    market = _test_market()
-    session = _test_session()
-    client.set_session(session)
-    client._markets_cache = _test_markets_response(market)
-    client._nonce_cache[session.trade_account_id] = 11
-
-    monkeypatch.setattr(
-        "o2_sdk.client.action_to_call",
-        lambda _action, _market_info: {"contract_id": b"", "asset_id": b"", "amount": 0},
-    )
-    monkeypatch.setattr("o2_sdk.client.build_actions_signing_bytes", lambda _nonce, _calls: b"x")
-    monkeypatch.setattr("o2_sdk.client.raw_sign", lambda _key, _payload: b"\x99" * 64)
+@pytest.mark.parametrize(
+    ("build", "check", "use_active_session"),
+    _BATCH_CASES,
+    ids=["builder-group", "chain-int", "low+high-level", "active-session"],
+)
+async def test_batch_actions(
+    client: O2Client,
+    market: Market,
+    session_info: SessionInfo,
+    patched_signing: SigningCapture,
+    build,
+    check,
+    use_active_session: bool,
+):
+    client._nonce_cache[session_info.trade_account_id] = 7
+    patched_signing.install_submit(client, _RESPONSE_AA)
+    actions = build(market)
+
+    if use_active_session:
+        client.set_session(session_info)
+        result = await client.batch_actions(actions, collect_orders=True)
+    else:
+        result = await client.batch_actions(actions, collect_orders=True, session=session_info)
+
+    assert result.success
+    req = patched_signing.request
+    assert patched_signing.owner == session_info.owner_address
+    assert req["nonce"] == "7"
+    assert req["collect_orders"] is True
+    check(req["actions"])
 
-    captured: dict = {}
 
-    async def fake_submit_actions(owner: str, request: dict) -> ActionsResponse:
-        captured["owner"] = owner
-        captured["request"] = request
-        return ActionsResponse.from_dict({"tx_id": "0x" + "dd" * 32})
+@pytest.mark.asyncio
+async def test_batch_actions_rejects_bad_chain_int_precision(
+    client: O2Client, market: Market, session_info: SessionInfo
+):
+    client._nonce_cache[session_info.trade_account_id] = 1
 
-    monkeypatch.setattr(client.api, "submit_actions", fake_submit_actions)
+    group = (
+        client.actions_for(market)
+        .create_order(OrderSide.BUY, ChainInt(100000000), ChainInt(5000000001))
+        .build()
+    )
 
-    group = client.actions_for(market).create_order(OrderSide.BUY, "0.1", "1").build()
-    result = await client.batch_actions([group], collect_orders=True)
-    assert result.success
-    assert captured["owner"] == session.owner_address
-    assert captured["request"]["nonce"] == "11"
+    with pytest.raises(O2Error, match="raw quantity precision"):
+        await client._normalize_market_actions(session_info, [group])
 
 
 @pytest.mark.asyncio
-async def test_create_order_uses_active_session(monkeypatch: pytest.MonkeyPatch):
-    client = O2Client()
-    market = _test_market()
-    session = _test_session()
-    client.set_session(session)
-    client._markets_cache = _test_markets_response(market)
+async def test_create_order_uses_active_session(
+    client: O2Client, market: Market, session_info: SessionInfo, monkeypatch: pytest.MonkeyPatch
+):
+    client.set_session(session_info)
 
     captured: dict = {}
 
@@ -279,7 +196,7 @@ async def test_create_order_uses_active_session(monkeypatch: pytest.MonkeyPatch)
         captured["actions"] = actions
         captured["collect_orders"] = collect_orders
         captured["session"] = session
-        return ActionsResponse.from_dict({"tx_id": "0x" + "ee" * 32})
+        return _RESPONSE_EE
 
     monkeypatch.setattr(client, "batch_actions", fake_batch_actions)
 
@@ -292,44 +209,36 @@ async def test_create_order_uses_active_session(monkeypatch: pytest.MonkeyPatch)
     )
     assert result.success
     assert captured["collect_orders"] is True
-    assert captured["session"] == session
+    assert captured["session"] == session_info
 
 
 @pytest.mark.asyncio
-async def test_batch_actions_requires_session():
-    client = O2Client()
-    market = _test_market()
+async def test_batch_actions_requires_session(client: O2Client, market: Market):
     low_level = MarketActions(market_id=market.market_id, actions=[])
     with pytest.raises(O2Error, match="No active session"):
         await client.batch_actions([low_level])
 
 
 @pytest.mark.asyncio
-async def test_create_session_accepts_market_model(monkeypatch: pytest.MonkeyPatch):
-    client = O2Client()
-    market = _test_market()
-    owner = client.generate_wallet()
-    client._markets_cache = _test_markets_response(market)
-
-    account = type(
-        "Account",
-        (),
-        {"exists": True, "trade_account_id": "0x" + "11" * 32, "nonce": 5},
-    )()
+async def test_create_session_accepts_market_model(
+    client: O2Client,
+    market: Market,
+    wallet: Wallet,
+    account: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    account.trade_account_id = _H11
+    account.nonce = 5
 
     async def fake_get_account(**_kwargs):
         return account
 
-    session_resp = type(
-        "SessionResp",
-        (),
-        {
-            "session_id": AddressIdentity("0x" + "aa" * 32),
-            "trade_account_id": "0x" + "11" * 32,
-            "contract_ids": [market.contract_id],
-            "session_expiry": "9999999999",
-        },
-    )()
+    session_resp = _StubSession(
+        session_id=SESSION_ID,
+        trade_account_id=_H11,
+        contract_ids=[market.contract_id],
+        session_expiry="9999999999",
+    )
 
     async def fake_create_session(_owner_id: str, _request: dict):
         return session_resp
@@ -338,22 +247,21 @@ async def test_create_session_accepts_market_model(monkeypatch: pytest.MonkeyPat
     monkeypatch.setattr(client.api, "create_session", fake_create_session)
     monkeypatch.setattr("o2_sdk.client.build_session_signing_bytes", lambda **_kwargs: b"x")
 
-    session = await client.create_session(owner=owner, markets=[market], expiry_days=1)
+    session = await client.create_session(owner=wallet, markets=[market], expiry_days=1)
     assert session.trade_account_id == session_resp.trade_account_id
     assert session.contract_ids[0] == market.contract_id
 
 
 @pytest.mark.asyncio
-async def test_top_up_from_faucet_mints_to_owner_trade_account(monkeypatch: pytest.MonkeyPatch):
-    client = O2Client()
-    owner = client.generate_wallet()
-    trade_account_id = "0x" + "12" * 32
+async def test_top_up_from_faucet_mints_to_owner_trade_account(
+    client: O2Client,
+    wallet: Wallet,
+    account: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    trade_account_id = _H12
 
-    account = type(
-        "Account",
-        (),
-        {"exists": True, "trade_account_id": trade_account_id},
-    )()
+    account.trade_account_id = trade_account_id
 
     async def fake_get_account(**_kwargs):
         return account
@@ -362,26 +270,24 @@ async def test_top_up_from_faucet_mints_to_owner_trade_account(monkeypatch: pyte
 
     async def fake_mint_to_contract(contract_id: str):
         captured["contract_id"] = contract_id
-        return type("FaucetResponse", (), {"success": True, "error": None})()
+        return SimpleNamespace(success=True, error=None)
 
     monkeypatch.setattr(client.api, "get_account", fake_get_account)
     monkeypatch.setattr(client.api, "mint_to_contract", fake_mint_to_contract)
 
-    response = await client.top_up_from_faucet(owner)
+    response = await client.top_up_from_faucet(wallet)
     assert response.success is True
     assert captured["contract_id"] == trade_account_id
 
 
 @pytest.mark.asyncio
-async def test_top_up_from_faucet_requires_existing_account(monkeypatch: pytest.MonkeyPatch):
-    client = O2Client()
-    owner = client.generate_wallet()
-
-    account = type(
-        "Account",
-        (),
-        {"exists": False, "trade_account_id": None},
-    )()
+async def test_top_up_from_faucet_requires_existing_account(
+    client: O2Client,
+    wallet: Wallet,
+    account: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    account.exists = False
 
     async def fake_get_account(**_kwargs):
         return account
@@ -393,14 +299,13 @@ async def test_top_up_from_faucet_requires_existing_account(monkeypatch: pytest.
     monkeypatch.setattr(client.api, "mint_to_contract", fake_mint_to_contract)
 
     with pytest.raises(O2Error, match="Call setup_account\\(\\) first"):
-        await client.top_up_from_faucet(owner)
+        await client.top_up_from_faucet(wallet)
 
 
 @pytest.mark.asyncio
-async def test_cancel_order_accepts_id(monkeypatch: pytest.MonkeyPatch):
-    client = O2Client()
-    market = _test_market()
-    session = _test_session()
+async def test_cancel_order_accepts_id(
+    client: O2Client, market: Market, session_info: SessionInfo, monkeypatch: pytest.MonkeyPatch
+):
 
     captured: dict = {}
 
@@ -411,69 +316,66 @@ async def test_cancel_order_accepts_id(monkeypatch: pytest.MonkeyPatch):
     ) -> ActionsResponse:
         captured["actions"] = actions
         captured["session"] = session
-        return ActionsResponse.from_dict({"tx_id": "0x" + "ff" * 32})
+        return _RESPONSE_FF
 
     monkeypatch.setattr(client, "batch_actions", fake_batch_actions)
 
-    await client.cancel_order(order_id=market.market_id, market=market, session=session)
+    await client.cancel_order(order_id=market.market_id, market=market, session=session_info)
     action = captured["actions"][0].actions[0]
     assert isinstance(action, type(captured["actions"][0].actions[0]))
     assert action.order_id == market.market_id
 
 
-@pytest.mark.asyncio
-async def test_setup_account_fail_fast_when_whitelist_required(monkeypatch: pytest.MonkeyPatch):
+@pytest.fixture
+def custom_client(request: pytest.FixtureRequest) -> O2Client:
+    """A client on a stub network; ``request.param`` sets the faucet/whitelist fields."""
     cfg = NetworkConfig(
-        api_base="https://x",
-        ws_url="wss://x",
-        fuel_rpc="https://rpc",
-        faucet_url=None,
-        whitelist_required=True,
+        api_base="https://x", ws_url="wss://x", fuel_rpc="https://rpc", **request.param
     )
-    client = O2Client(custom_config=cfg)
-    wallet = client.generate_wallet()
+    return O2Client(custom_config=cfg)
 
-    account = type(
-        "Account",
-        (),
-        {"exists": True, "trade_account_id": "0x" + "11" * 32},
-    )()
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "custom_client", [{"faucet_url": None, "whitelist_required": True}], indirect=True
+)
+async def test_setup_account_fail_fast_when_whitelist_required(
+    custom_client: O2Client,
+    wallet: Wallet,
+    account: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    account.trade_account_id = _H11
 
     async def fake_get_account(**_kwargs):
         return account
 
-    monkeypatch.setattr(client.api, "get_account", fake_get_account)
+    monkeypatch.setattr(custom_client.api, "get_account", fake_get_account)
 
     async def fake_retry_whitelist(_trade_account_id: str) -> bool:
         return False
 
-    monkeypatch.setattr(client, "_retry_whitelist_account", fake_retry_whitelist)
+    monkeypatch.setattr(custom_client, "_retry_whitelist_account", fake_retry_whitelist)
     with pytest.raises(O2Error, match="Failed to whitelist account"):
-        await client.setup_account(wallet)
+        await custom_client.setup_account(wallet)
 
 
 @pytest.mark.asyncio
-async def test_setup_account_skips_whitelist_when_not_required(monkeypatch: pytest.MonkeyPatch):
-    cfg = NetworkConfig(
-        api_base="https://x",
-        ws_url="wss://x",
-        fuel_rpc="https://rpc",
-        faucet_url=None,
-        whitelist_required=False,
-    )
-    client = O2Client(custom_config=cfg)
-    wallet = client.generate_wallet()
-
-    account = type(
-        "Account",
-        (),
-        {"exists": True, "trade_account_id": "0x" + "22" * 32},
-    )()
+@pytest.mark.parametrize(
+    "custom_client", [{"faucet_url": None, "whitelist_required": False}], indirect=True
+)
+async def test_setup_account_skips_whitelist_when_not_required(
+    custom_client: O2Client,
+    wallet: Wallet,
+    account: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    account.trade_account_id = _H22
 
     async def fake_get_account(**_kwargs):
         return account
 
-    monkeypatch.setattr(client.api, "get_account", fake_get_account)
+    monkeypatch.setattr(custom_client.api, "get_account", fake_get_account)
 
     called = {"whitelist": False}
 
@@ -481,34 +383,28 @@ async def test_setup_account_skips_whitelist_when_not_required(monkeypatch: pyte
         called["whitelist"] = True
         return True
 
-    monkeypatch.setattr(client, "_retry_whitelist_account", fake_retry_whitelist)
-    out = await client.setup_account(wallet)
+    monkeypatch.setattr(custom_client, "_retry_whitelist_account", fake_retry_whitelist)
+    out = await custom_client.setup_account(wallet)
     assert out.trade_account_id == account.trade_account_id
     assert called["whitelist"] is False
 
 
 @pytest.mark.asyncio
-async def test_setup_account_skips_faucet_when_balance_present(monkeypatch: pytest.MonkeyPatch):
-    cfg = NetworkConfig(
-        api_base="https://x",
-        ws_url="wss://x",
-        fuel_rpc="https://rpc",
-        faucet_url="https://faucet",
-        whitelist_required=False,
-    )
-    client = O2Client(custom_config=cfg)
-    wallet = client.generate_wallet()
-
-    account = type(
-        "Account",
-        (),
-        {"exists": True, "trade_account_id": "0x" + "33" * 32},
-    )()
+@pytest.mark.parametrize(
+    "custom_client", [{"faucet_url": "https://faucet", "whitelist_required": False}], indirect=True
+)
+async def test_setup_account_skips_faucet_when_balance_present(
+    custom_client: O2Client,
+    wallet: Wallet,
+    account: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    account.trade_account_id = _H33
 
     async def fake_get_account(**_kwargs):
         return account
 
-    monkeypatch.setattr(client.api, "get_account", fake_get_account)
+    monkeypatch.setattr(custom_client.api, "get_account", fake_get_account)
 
     async def fake_has_balance(_trade_account_id: str) -> bool:
         return True
@@ -519,9 +415,9 @@ async def test_setup_account_skips_faucet_when_balance_present(monkeypatch: pyte
         called["mint"] = True
         return True
 
-    monkeypatch.setattr(client, "_has_any_balance", fake_has_balance)
-    monkeypatch.setattr(client, "_retry_mint_to_contract", fake_retry_mint)
-    out = await client.setup_account(wallet)
+    monkeypatch.setattr(custom_client, "_has_any_balance", fake_has_balance)
+    monkeypatch.setattr(custom_client, "_retry_mint_to_contract", fake_retry_mint)
+    out = await custom_client.setup_account(wallet)
     assert out.trade_account_id == account.trade_account_id
     assert called["mint"] is False
 
@@ -534,37 +430,25 @@ from o2_sdk.errors import InvalidRequest  # noqa: E402
 
 
 @pytest.mark.asyncio
-async def test_get_depth_rejects_precision_0():
-    client = O2Client()
-    market = _test_market()
-    client._markets_cache = _test_markets_response(market)
+async def test_get_depth_rejects_precision_0(client: O2Client, market: Market):
     with pytest.raises(InvalidRequest, match="Invalid depth precision 0"):
         await client.get_depth(market, precision=0)
 
 
 @pytest.mark.asyncio
-async def test_get_depth_rejects_precision_19():
-    client = O2Client()
-    market = _test_market()
-    client._markets_cache = _test_markets_response(market)
+async def test_get_depth_rejects_precision_19(client: O2Client, market: Market):
     with pytest.raises(InvalidRequest, match="Invalid depth precision 19"):
         await client.get_depth(market, precision=19)
 
 
 @pytest.mark.asyncio
-async def test_get_depth_rejects_negative_precision():
-    client = O2Client()
-    market = _test_market()
-    client._markets_cache = _test_markets_response(market)
+async def test_get_depth_rejects_negative_precision(client: O2Client, market: Market):
     with pytest.raises(InvalidRequest, match="Invalid depth precision -1"):
         await client.get_depth(market, precision=-1)
 
 
 @pytest.mark.asyncio
-async def test_stream_depth_rejects_precision_0():
-    client = O2Client()
-    market = _test_market()
-    client._markets_cache = _test_markets_response(market)
+async def test_stream_depth_rejects_precision_0(client: O2Client, market: Market):
     with pytest.raises(InvalidRequest, match="Invalid depth precision 0"):
         async for _ in client.stream_depth(market, precision=0):
             pass
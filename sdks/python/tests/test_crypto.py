@@ -1,13 +1,20 @@
 """Unit tests for the crypto module using known test vectors."""
 
+import copy
 import hashlib
+import pickle
 
+import pytest
 from coincurve import PrivateKey
+from Crypto.Hash import keccak
 
 from o2_sdk.crypto import (
+    EvmWallet,
     ExternalEvmSigner,
     ExternalSigner,
     Signer,
+    Wallet,
+    _sign_with_pk,
     evm_personal_sign,
     evm_personal_sign_digest,
     fuel_compact_sign,
@@ -17,6 +24,7 @@ from o2_sdk.crypto import (
     generate_wallet,
     load_evm_wallet,
     load_wallet,
+    load_wallet_bytes,
     personal_sign,
     raw_sign,
     to_fuel_compact_signature,
@@ -25,6 +33,43 @@ from o2_sdk.crypto import (
 # Known test private key for deterministic tests
 TEST_PRIVATE_KEY_HEX = "a" * 64
 TEST_PRIVATE_KEY = bytes.fromhex(TEST_PRIVATE_KEY_HEX)
+_TEST_PK = PrivateKey(TEST_PRIVATE_KEY)
+_TEST_PUB_UNCOMPRESSED = _TEST_PK.public_key.format(compressed=False)
+_TEST_EXPECTED_FUEL_ADDR = "0x" + hashlib.sha256(memoryview(_TEST_PUB_UNCOMPRESSED)[1:]).hexdigest()
+
+
+# Reference keccak256, computed independently of the SDK's digest helpers.
+# OpenSSL >= 3.2 ships the original (pre-SHA-3 padding) Keccak as "KECCAK-256";
+# older builds fall back to pycryptodome.
+try:
+    hashlib.new("KECCAK-256")
+except ValueError:
+
+    def _keccak256(data: bytes) -> bytes:
+        return keccak.new(data=data, digest_bits=256).digest()
+
+else:
+
+    def _keccak256(data: bytes) -> bytes:
+        return hashlib.new("KECCAK-256", data).digest()
+
+
+# Reference personal_sign digests for the fixed messages used below.
+_TEST_FUEL_DIGEST = hashlib.sha256(b"\x19Fuel Signed Message:\n4test").digest()
+_HELLO_FUEL_DIGEST = hashlib.sha256(b"\x19Fuel Signed Message:\n5hello").digest()
+_HELLO_EVM_DIGEST = _keccak256(b"\x19Ethereum Signed Message:\n5hello")
+
+
+# Loading derives the public key and address; do it once and share the
+# wallets, which no test mutates.
+@pytest.fixture(scope="module")
+def fuel_wallet() -> Wallet:
+    return load_wallet_bytes(TEST_PRIVATE_KEY)
+
+
+@pytest.fixture(scope="module")
+def evm_wallet() -> EvmWallet:
+    return load_evm_wallet(TEST_PRIVATE_KEY_HEX)
 
 
 class TestKeyGeneration:
@@ -43,13 +88,13 @@ class TestKeyGeneration:
         assert wallet.b256_address.startswith("0x")
         assert len(wallet.address_bytes) == 32
 
-    def test_load_wallet_deterministic(self):
-        wallet = load_wallet(TEST_PRIVATE_KEY_HEX)
-        pk = PrivateKey(TEST_PRIVATE_KEY)
-        pub = pk.public_key.format(compressed=False)
-        expected_address = "0x" + hashlib.sha256(pub[1:]).hexdigest()
-        assert wallet.b256_address == expected_address
-        assert wallet.private_key == TEST_PRIVATE_KEY
+    def test_load_wallet_deterministic(self, fuel_wallet):
+        assert fuel_wallet.b256_address == _TEST_EXPECTED_FUEL_ADDR
+        assert fuel_wallet.private_key == TEST_PRIVATE_KEY
+
+    def test_load_wallet_hex_matches_bytes(self, fuel_wallet):
+        assert load_wallet(TEST_PRIVATE_KEY_HEX) == fuel_wallet
+        assert load_wallet("0x" + TEST_PRIVATE_KEY_HEX) == fuel_wallet
 
     def test_evm_wallet(self):
         wallet = generate_evm_wallet()
@@ -58,15 +103,12 @@ class TestKeyGeneration:
         evm_part = wallet.b256_address[26:]  # strip 0x + 24 zeros
         assert evm_part == wallet.evm_address[2:]
 
-    def test_load_evm_wallet_deterministic(self):
-        wallet = load_evm_wallet(TEST_PRIVATE_KEY_HEX)
-        assert wallet.b256_address.startswith("0x000000000000000000000000")
-        assert wallet.private_key == TEST_PRIVATE_KEY
+    def test_load_evm_wallet_deterministic(self, evm_wallet):
+        assert evm_wallet.b256_address.startswith("0x000000000000000000000000")
+        assert evm_wallet.private_key == TEST_PRIVATE_KEY
 
-    def test_fuel_vs_evm_address_different(self):
-        fuel = load_wallet(TEST_PRIVATE_KEY_HEX)
-        evm = load_evm_wallet(TEST_PRIVATE_KEY_HEX)
-        assert fuel.b256_address != evm.b256_address
+    def test_fuel_vs_evm_address_different(self, fuel_wallet, evm_wallet):
+        assert fuel_wallet.b256_address != evm_wallet.b256_address
 
 
 class TestFuelCompactSign:
@@ -82,25 +124,21 @@ class TestFuelCompactSign:
         recovery_id = (sig[32] >> 7) & 1
         assert recovery_id in (0, 1)
 
-    def test_deterministic_signature(self):
-        digest = hashlib.sha256(b"deterministic test").digest()
-        sig1 = fuel_compact_sign(TEST_PRIVATE_KEY, digest)
-        sig2 = fuel_compact_sign(TEST_PRIVATE_KEY, digest)
-        assert sig1 == sig2
+    def test_prebuilt_key_matches_raw_key_bytes(self):
+        digest = hashlib.sha256(b"prebuilt key").digest()
+        assert _sign_with_pk(_TEST_PK, digest) == fuel_compact_sign(TEST_PRIVATE_KEY, digest)
 
     def test_low_s_normalization(self):
         """Verify that s values are in the lower half of the curve order."""
         SECP256K1_ORDER = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
         half_order = SECP256K1_ORDER // 2
 
-        for i in range(20):
-            digest = hashlib.sha256(f"low-s test {i}".encode()).digest()
-            sig = fuel_compact_sign(TEST_PRIVATE_KEY, digest)
-            # Extract s (bytes 32-63), but first clear the recovery ID bit
-            s_bytes = bytearray(sig[32:64])
-            s_bytes[0] = s_bytes[0] & 0x7F
-            s = int.from_bytes(s_bytes, "big")
-            assert s <= half_order, f"s value not normalized at iteration {i}"
+        digests = [hashlib.sha256(f"low-s test {i}".encode()).digest() for i in range(20)]
+        sigs = [fuel_compact_sign(TEST_PRIVATE_KEY, digest) for digest in digests]
+        # Extract s (bytes 32-63) with the recovery ID bit (bit 255) masked off
+        s_mask = (1 << 255) - 1
+        s_values = [int.from_bytes(memoryview(sig)[32:64], "big") & s_mask for sig in sigs]
+        assert max(s_values) <= half_order, "s value not normalized"
 
 
 class TestFuelPersonalSignDigest:
@@ -117,9 +155,6 @@ class TestFuelPersonalSignDigest:
         expected = hashlib.sha256(prefix + length_str + msg).digest()
         assert fuel_personal_sign_digest(msg) == expected
 
-    def test_deterministic(self):
-        assert fuel_personal_sign_digest(b"x") == fuel_personal_sign_digest(b"x")
-
     def test_different_messages_differ(self):
         assert fuel_personal_sign_digest(b"a") != fuel_personal_sign_digest(b"b")
 
@@ -138,18 +173,14 @@ class TestEvmPersonalSignDigest:
         digest = evm_personal_sign_digest(b"hello")
         assert len(digest) == 32
 
-    def test_matches_manual_computation(self):
-        from Crypto.Hash import keccak
+    def test_reference_keccak_known_vector(self):
+        expected = "c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470"
+        assert _keccak256(b"").hex() == expected
 
+    def test_matches_manual_computation(self):
         msg = b"test"
         prefix = f"\x19Ethereum Signed Message:\n{len(msg)}".encode()
-        k = keccak.new(digest_bits=256)
-        k.update(prefix + msg)
-        expected = k.digest()
-        assert evm_personal_sign_digest(msg) == expected
-
-    def test_deterministic(self):
-        assert evm_personal_sign_digest(b"x") == evm_personal_sign_digest(b"x")
+        assert evm_personal_sign_digest(msg) == _keccak256(prefix + msg)
 
     def test_different_messages_differ(self):
         assert evm_personal_sign_digest(b"a") != evm_personal_sign_digest(b"b")
@@ -165,11 +196,6 @@ class TestPersonalSign:
         sig = personal_sign(TEST_PRIVATE_KEY, b"hello world")
         assert len(sig) == 64
 
-    def test_personal_sign_deterministic(self):
-        sig1 = personal_sign(TEST_PRIVATE_KEY, b"hello")
-        sig2 = personal_sign(TEST_PRIVATE_KEY, b"hello")
-        assert sig1 == sig2
-
     def test_personal_sign_different_messages(self):
         sig1 = personal_sign(TEST_PRIVATE_KEY, b"message1")
         sig2 = personal_sign(TEST_PRIVATE_KEY, b"message2")
@@ -177,10 +203,8 @@ class TestPersonalSign:
 
     def test_personal_sign_prefix_applied(self):
         """Verify personalSign uses the Fuel prefix via shared digest helper."""
-        msg = b"test"
-        digest = fuel_personal_sign_digest(msg)
-        expected = fuel_compact_sign(TEST_PRIVATE_KEY, digest)
-        actual = personal_sign(TEST_PRIVATE_KEY, msg)
+        expected = fuel_compact_sign(TEST_PRIVATE_KEY, _TEST_FUEL_DIGEST)
+        actual = personal_sign(TEST_PRIVATE_KEY, b"test")
         assert actual == expected
 
 
@@ -189,11 +213,6 @@ class TestRawSign:
         sig = raw_sign(TEST_PRIVATE_KEY, b"hello world")
         assert len(sig) == 64
 
-    def test_raw_sign_deterministic(self):
-        sig1 = raw_sign(TEST_PRIVATE_KEY, b"hello")
-        sig2 = raw_sign(TEST_PRIVATE_KEY, b"hello")
-        assert sig1 == sig2
-
     def test_raw_sign_is_sha256_then_sign(self):
         """Verify rawSign is sha256(message) then fuel_compact_sign."""
         msg = b"test raw sign"
@@ -231,6 +250,23 @@ class TestEvmPersonalSign:
         assert fuel_sig != evm_sig
 
 
+class TestDeterministicSigning:
+    """Signing the same input twice yields the same signature (RFC 6979 nonces)."""
+
+    @pytest.mark.parametrize(
+        ("sign_fn", "msg"),
+        [
+            (fuel_compact_sign, hashlib.sha256(b"deterministic test").digest()),
+            (personal_sign, b"hello"),
+            (raw_sign, b"hello"),
+            (evm_personal_sign, b"hello"),
+        ],
+        ids=["fuel_compact_sign", "personal_sign", "raw_sign", "evm_personal_sign"],
+    )
+    def test_deterministic(self, sign_fn, msg):
+        assert sign_fn(TEST_PRIVATE_KEY, msg) == sign_fn(TEST_PRIVATE_KEY, msg)
+
+
 class TestToFuelCompactSignature:
     def test_roundtrip(self):
         """to_fuel_compact_signature matches fuel_compact_sign output."""
@@ -239,8 +275,7 @@ class TestToFuelCompactSignature:
         expected = fuel_compact_sign(TEST_PRIVATE_KEY, digest)
 
         # Manually sign to get (r, s, recovery_id) components
-        pk = PrivateKey(TEST_PRIVATE_KEY)
-        sig = pk.sign_recoverable(digest, hasher=None)
+        sig = _TEST_PK.sign_recoverable(digest, hasher=None)
         r = sig[0:32]
         s = sig[32:64]
         recovery_id = sig[64]
@@ -249,20 +284,14 @@ class TestToFuelCompactSignature:
         assert result == expected
 
     def test_invalid_r_length(self):
-        import pytest
-
         with pytest.raises(ValueError, match="r must be 32 bytes"):
             to_fuel_compact_signature(b"\x00" * 31, b"\x00" * 32, 0)
 
     def test_invalid_s_length(self):
-        import pytest
-
         with pytest.raises(ValueError, match="s must be 32 bytes"):
             to_fuel_compact_signature(b"\x00" * 32, b"\x00" * 33, 0)
 
     def test_invalid_recovery_id(self):
-        import pytest
-
         with pytest.raises(ValueError, match="recovery_id must be 0 or 1"):
             to_fuel_compact_signature(b"\x00" * 32, b"\x00" * 32, 2)
 
@@ -270,37 +299,38 @@ class TestToFuelCompactSignature:
 class TestWalletPersonalSign:
     """Test Wallet.personal_sign method matches module-level personal_sign."""
 
-    def test_matches_module_function(self):
-        wallet = load_wallet(TEST_PRIVATE_KEY_HEX)
+    def test_matches_module_function(self, fuel_wallet):
         msg = b"test personal sign method"
         expected = personal_sign(TEST_PRIVATE_KEY, msg)
-        assert wallet.personal_sign(msg) == expected
+        assert fuel_wallet.personal_sign(msg) == expected
 
-    def test_deterministic(self):
-        wallet = load_wallet(TEST_PRIVATE_KEY_HEX)
-        msg = b"deterministic"
-        assert wallet.personal_sign(msg) == wallet.personal_sign(msg)
-
-    def test_different_messages_differ(self):
-        wallet = load_wallet(TEST_PRIVATE_KEY_HEX)
-        sig1 = wallet.personal_sign(b"message1")
-        sig2 = wallet.personal_sign(b"message2")
+    def test_different_messages_differ(self, fuel_wallet):
+        sig1 = fuel_wallet.personal_sign(b"message1")
+        sig2 = fuel_wallet.personal_sign(b"message2")
         assert sig1 != sig2
 
 
+class TestWalletCopies:
+    @pytest.mark.parametrize("wallet_fixture", ["fuel_wallet", "evm_wallet"])
+    def test_copies_after_signing(self, request, wallet_fixture):
+        wallet = request.getfixturevalue(wallet_fixture)
+        signature = wallet.personal_sign(b"before copy")
+
+        for clone in (copy.deepcopy(wallet), pickle.loads(pickle.dumps(wallet))):
+            assert clone == wallet
+            assert clone.personal_sign(b"before copy") == signature
+
+
 class TestEvmWalletPersonalSign:
     """Test EvmWallet.personal_sign method matches module-level evm_personal_sign."""
 
-    def test_matches_module_function(self):
-        wallet = load_evm_wallet(TEST_PRIVATE_KEY_HEX)
+    def test_matches_module_function(self, evm_wallet):
         msg = b"test evm personal sign method"
         expected = evm_personal_sign(TEST_PRIVATE_KEY, msg)
-        assert wallet.personal_sign(msg) == expected
+        assert evm_wallet.personal_sign(msg) == expected
 
-    def test_fuel_vs_evm_differ(self):
+    def test_fuel_vs_evm_differ(self, fuel_wallet, evm_wallet):
         """Wallet.personal_sign and EvmWallet.personal_sign produce different results."""
-        fuel_wallet = load_wallet(TEST_PRIVATE_KEY_HEX)
-        evm_wallet = load_evm_wallet(TEST_PRIVATE_KEY_HEX)
         msg = b"same message"
         assert fuel_wallet.personal_sign(msg) != evm_wallet.personal_sign(msg)
 
@@ -308,13 +338,9 @@ class TestEvmWalletPersonalSign:
 class TestSignerProtocol:
     """Test that Wallet and EvmWallet satisfy the Signer protocol."""
 
-    def test_wallet_is_signer(self):
-        wallet = load_wallet(TEST_PRIVATE_KEY_HEX)
-        assert isinstance(wallet, Signer)
-
-    def test_evm_wallet_is_signer(self):
-        wallet = load_evm_wallet(TEST_PRIVATE_KEY_HEX)
-        assert isinstance(wallet, Signer)
+    @pytest.mark.parametrize("wallet_fixture", ["fuel_wallet", "evm_wallet"])
+    def test_wallet_is_signer(self, request, wallet_fixture):
+        assert isinstance(request.getfixturevalue(wallet_fixture), Signer)
 
     def test_external_signer_is_signer(self):
         signer = ExternalSigner(
@@ -335,20 +361,19 @@ class TestSignerProtocol:
 class TestExternalSigner:
     """Test ExternalSigner with fuel_compact_sign as the backing function."""
 
-    def test_matches_wallet(self):
+    def test_matches_wallet(self, fuel_wallet):
         """ExternalSigner using fuel_compact_sign should match Wallet.personal_sign."""
-        wallet = load_wallet(TEST_PRIVATE_KEY_HEX)
 
         def local_sign(digest: bytes) -> bytes:
             return fuel_compact_sign(TEST_PRIVATE_KEY, digest)
 
         signer = ExternalSigner(
-            b256_address=wallet.b256_address,
+            b256_address=fuel_wallet.b256_address,
             sign_digest=local_sign,
         )
 
         msg = b"test external signer"
-        assert signer.personal_sign(msg) == wallet.personal_sign(msg)
+        assert signer.personal_sign(msg) == fuel_wallet.personal_sign(msg)
 
     def test_b256_address(self):
         addr = "0x" + "ab" * 32
@@ -373,32 +398,28 @@ class TestExternalSigner:
             sign_digest=capture_digest,
         )
 
-        msg = b"hello"
-        signer.personal_sign(msg)
+        signer.personal_sign(b"hello")
 
-        expected_digest = fuel_personal_sign_digest(msg)
-        assert len(received_digests) == 1
-        assert received_digests[0] == expected_digest
+        assert received_digests == [_HELLO_FUEL_DIGEST]
 
 
 class TestExternalEvmSigner:
     """Test ExternalEvmSigner with fuel_compact_sign as the backing function."""
 
-    def test_matches_evm_wallet(self):
+    def test_matches_evm_wallet(self, evm_wallet):
         """ExternalEvmSigner using fuel_compact_sign should match EvmWallet.personal_sign."""
-        wallet = load_evm_wallet(TEST_PRIVATE_KEY_HEX)
 
         def local_sign(digest: bytes) -> bytes:
             return fuel_compact_sign(TEST_PRIVATE_KEY, digest)
 
         signer = ExternalEvmSigner(
-            b256_address=wallet.b256_address,
-            evm_address=wallet.evm_address,
+            b256_address=evm_wallet.b256_address,
+            evm_address=evm_wallet.evm_address,
             sign_digest=local_sign,
         )
 
         msg = b"test external evm signer"
-        assert signer.personal_sign(msg) == wallet.personal_sign(msg)
+        assert signer.personal_sign(msg) == evm_wallet.personal_sign(msg)
 
     def test_evm_address(self):
         evm_addr = "0x" + "cd" * 20
@@ -423,9 +444,6 @@ class TestExternalEvmSigner:
             sign_digest=capture_digest,
         )
 
-        msg = b"hello"
-        signer.personal_sign(msg)
+        signer.personal_sign(b"hello")
 
-        expected_digest = evm_personal_sign_digest(msg)
-        assert len(received_digests) == 1
-        assert received_digests[0] == expected_digest
+        assert received_digests == [_HELLO_EVM_DIGEST]
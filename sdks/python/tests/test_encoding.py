@@ -1,8 +1,11 @@
 """Unit tests for the encoding module."""
 
 import struct
+from enum import IntEnum
 from typing import ClassVar
 
+import pytest
+
 from o2_sdk.encoding import (
     GAS_MAX,
     action_to_call,
@@ -17,16 +20,22 @@ from o2_sdk.encoding import (
     u64_be,
 )
 
+# Shared all-zero 32-byte address / asset ID (bytes are immutable).
+_ZERO32 = bytes(32)
+# u64 encodings of 0 and u64::MAX.
+_Z8 = b"\x00" * 8
+_F8 = b"\xff" * 8
+
 
 class TestU64Be:
     def test_zero(self):
-        assert u64_be(0) == b"\x00" * 8
+        assert u64_be(0) == _Z8
 
     def test_one(self):
         assert u64_be(1) == b"\x00" * 7 + b"\x01"
 
     def test_max(self):
-        assert u64_be(GAS_MAX) == b"\xff" * 8
+        assert u64_be(GAS_MAX) == _F8
 
     def test_known_value(self):
         # 256 = 0x100
@@ -41,64 +50,39 @@ class TestU64Be:
 
 
 class TestFunctionSelector:
-    def test_create_order(self):
-        result = function_selector("create_order")
-        # "create_order" = 12 chars
-        assert result[:8] == u64_be(12)
-        assert result[8:] == b"create_order"
-        assert len(result) == 20
-
-    def test_cancel_order(self):
-        result = function_selector("cancel_order")
-        assert result[:8] == u64_be(12)
-        assert result[8:] == b"cancel_order"
-        assert len(result) == 20
-
-    def test_settle_balance(self):
-        result = function_selector("settle_balance")
-        assert result[:8] == u64_be(14)
-        assert result[8:] == b"settle_balance"
-        assert len(result) == 22
-
-    def test_register_referer(self):
-        result = function_selector("register_referer")
-        assert result[:8] == u64_be(16)
-        assert result[8:] == b"register_referer"
-        assert len(result) == 24
-
-    def test_set_session(self):
-        result = function_selector("set_session")
-        assert result[:8] == u64_be(11)
-        assert result[8:] == b"set_session"
-
-    def test_known_hex_create_order(self):
-        """Verify create_order selector matches known hex from the guide."""
-        result = function_selector("create_order")
-        expected = bytes.fromhex(
-            "000000000000000c"  # u64(12)
-            "6372656174655f6f72646572"  # "create_order"
-        )
-        assert result == expected
-
-    def test_known_hex_cancel_order(self):
-        result = function_selector("cancel_order")
-        expected = bytes.fromhex("000000000000000c63616e63656c5f6f72646572")
-        assert result == expected
-
-    def test_known_hex_settle_balance(self):
-        result = function_selector("settle_balance")
-        expected = bytes.fromhex("000000000000000e736574746c655f62616c616e6365")
-        assert result == expected
-
-    def test_known_hex_register_referer(self):
-        result = function_selector("register_referer")
-        expected = bytes.fromhex("000000000000001072656769737465725f72656665726572")
-        assert result == expected
+    @pytest.mark.parametrize(
+        ("name", "name_len"),
+        [
+            ("create_order", 12),
+            ("cancel_order", 12),
+            ("settle_balance", 14),
+            ("register_referer", 16),
+            ("set_session", 11),
+        ],
+    )
+    def test_layout(self, name, name_len):
+        result = function_selector(name)
+        assert result[:8] == u64_be(name_len)
+        assert result[8:] == name.encode()
+        assert len(result) == 8 + name_len
+
+    @pytest.mark.parametrize(
+        ("name", "expected_hex"),
+        [
+            # u64(12) + "create_order", as given in the integration guide
+            ("create_order", "000000000000000c6372656174655f6f72646572"),
+            ("cancel_order", "000000000000000c63616e63656c5f6f72646572"),
+            ("settle_balance", "000000000000000e736574746c655f62616c616e6365"),
+            ("register_referer", "000000000000001072656769737465725f72656665726572"),
+        ],
+    )
+    def test_known_hex(self, name, expected_hex):
+        assert function_selector(name) == bytes.fromhex(expected_hex)
 
 
 class TestEncodeIdentity:
     def test_address(self):
-        addr = bytes(32)
+        addr = _ZERO32
         result = encode_identity(0, addr)
         assert result == u64_be(0) + addr
         assert len(result) == 40
@@ -129,27 +113,15 @@ class TestEncodeOption:
 
 
 class TestEncodeOrderArgs:
-    def test_spot(self):
-        result = encode_order_args(100000000, 5000000000, "Spot")
+    @pytest.mark.parametrize(
+        ("kind", "tag"), [("Spot", 1), ("FillOrKill", 2), ("PostOnly", 3), ("Market", 4)]
+    )
+    def test_simple_variant(self, kind, tag):
+        result = encode_order_args(100000000, 5000000000, kind)
         assert len(result) == 24  # 8 + 8 + 8
         assert result[:8] == u64_be(100000000)
         assert result[8:16] == u64_be(5000000000)
-        assert result[16:24] == u64_be(1)  # Spot variant = 1
-
-    def test_market(self):
-        result = encode_order_args(100000000, 5000000000, "Market")
-        assert len(result) == 24
-        assert result[16:24] == u64_be(4)  # Market variant = 4
-
-    def test_fill_or_kill(self):
-        result = encode_order_args(100000000, 5000000000, "FillOrKill")
-        assert len(result) == 24
-        assert result[16:24] == u64_be(2)  # FillOrKill variant = 2
-
-    def test_post_only(self):
-        result = encode_order_args(100000000, 5000000000, "PostOnly")
-        assert len(result) == 24
-        assert result[16:24] == u64_be(3)  # PostOnly variant = 3
+        assert result[16:24] == u64_be(tag)
 
     def test_limit(self):
         result = encode_order_args(
@@ -183,8 +155,8 @@ class TestBuildSessionSigningBytes:
     def test_structure(self):
         nonce = 0
         chain_id = 0
-        session_addr = bytes(32)
-        contract_ids = [bytes(32)]
+        session_addr = _ZERO32
+        contract_ids = [_ZERO32]
         expiry = 1737504000
 
         result = build_session_signing_bytes(nonce, chain_id, session_addr, contract_ids, expiry)
@@ -218,7 +190,7 @@ class TestBuildSessionSigningBytes:
         assert result[offset : offset + 8] == u64_be(1)
         offset += 8
         # contract_id
-        assert result[offset : offset + 32] == bytes(32)
+        assert result[offset : offset + 32] == _ZERO32
         offset += 32
 
         assert offset == len(result)
@@ -227,7 +199,7 @@ class TestBuildSessionSigningBytes:
         cid1 = bytes(range(32))
         cid2 = bytes(range(32, 64))
         result = build_session_signing_bytes(
-            nonce=1, chain_id=0, session_address=bytes(32), contract_ids=[cid1, cid2], expiry=100
+            nonce=1, chain_id=0, session_address=_ZERO32, contract_ids=[cid1, cid2], expiry=100
         )
         # The contract IDs should both be present
         assert cid1 in result
@@ -235,14 +207,17 @@ class TestBuildSessionSigningBytes:
 
 
 class TestBuildActionsSigningBytes:
+    CREATE_ORDER_SEL: ClassVar[bytes] = function_selector("create_order")
+
     def test_single_call(self):
+        call_data = encode_order_args(100000000, 5000000000, "Spot")
         call = {
-            "contract_id": bytes(32),
-            "function_selector": function_selector("create_order"),
+            "contract_id": _ZERO32,
+            "function_selector": self.CREATE_ORDER_SEL,
             "amount": 500000000,
-            "asset_id": bytes(32),
+            "asset_id": _ZERO32,
             "gas": GAS_MAX,
-            "call_data": encode_order_args(100000000, 5000000000, "Spot"),
+            "call_data": call_data,
         }
         result = build_actions_signing_bytes(nonce=0, calls=[call])
 
@@ -254,10 +229,10 @@ class TestBuildActionsSigningBytes:
         assert result[offset : offset + 8] == u64_be(1)
         offset += 8
         # contract_id
-        assert result[offset : offset + 32] == bytes(32)
+        assert result[offset : offset + 32] == _ZERO32
         offset += 32
         # selector_len
-        selector = function_selector("create_order")
+        selector = self.CREATE_ORDER_SEL
         assert result[offset : offset + 8] == u64_be(len(selector))
         offset += 8
         # selector
@@ -267,7 +242,7 @@ class TestBuildActionsSigningBytes:
         assert result[offset : offset + 8] == u64_be(500000000)
         offset += 8
         # asset_id
-        assert result[offset : offset + 32] == bytes(32)
+        assert result[offset : offset + 32] == _ZERO32
         offset += 32
         # gas
         assert result[offset : offset + 8] == u64_be(GAS_MAX)
@@ -275,7 +250,6 @@ class TestBuildActionsSigningBytes:
         # option call_data (Some)
         assert result[offset : offset + 8] == u64_be(1)  # Some
         offset += 8
-        call_data = encode_order_args(100000000, 5000000000, "Spot")
         assert result[offset : offset + 8] == u64_be(len(call_data))
         offset += 8
         assert result[offset : offset + len(call_data)] == call_data
@@ -292,6 +266,12 @@ class TestActionToCall:
         "quote": {"asset": "0x" + "22" * 32, "decimals": 9},
         "accounts_registry_id": "0x" + "33" * 32,
     }
+    CREATE_ORDER_SEL: ClassVar[bytes] = function_selector("create_order")
+    _HEX_AB: ClassVar[bytes] = bytes.fromhex("ab" * 32)
+    _HEX_11: ClassVar[bytes] = bytes.fromhex("11" * 32)
+    _HEX_22: ClassVar[bytes] = bytes.fromhex("22" * 32)
+    _HEX_DD: ClassVar[bytes] = bytes.fromhex("dd" * 32)
+    _HEX_FF: ClassVar[bytes] = bytes.fromhex("ff" * 32)
 
     def test_create_order_buy(self):
         action = {
@@ -303,13 +283,36 @@ class TestActionToCall:
             }
         }
         call = action_to_call(action, self.MARKET_INFO)
-        assert call["contract_id"] == bytes.fromhex("ab" * 32)
-        assert call["function_selector"] == function_selector("create_order")
+        assert call["contract_id"] == self._HEX_AB
+        assert call["function_selector"] == self.CREATE_ORDER_SEL
         # amount = (100000000 * 5000000000) // 10^9 = 500000000
         assert call["amount"] == 500000000
-        assert call["asset_id"] == bytes.fromhex("22" * 32)  # quote asset for buy
+        assert call["asset_id"] == self._HEX_22  # quote asset for buy
         assert call["gas"] == GAS_MAX
 
+    def test_create_order_accepts_int_fields(self):
+        as_str = {"side": "Buy", "price": "100000000", "quantity": "5000000000"}
+        as_int = {"side": "Buy", "price": 100000000, "quantity": 5000000000}
+        order_type = {"Limit": [100000000, 1734876543]}
+        expected = action_to_call(
+            {"CreateOrder": {**as_str, "order_type": {"Limit": ["100000000", "1734876543"]}}},
+            self.MARKET_INFO,
+        )
+        call = action_to_call(
+            {"CreateOrder": {**as_int, "order_type": order_type}}, self.MARKET_INFO
+        )
+        assert call == expected
+
+        class Price(IntEnum):
+            LIMIT = 100000000
+
+        as_int_subclass = {**as_int, "price": Price.LIMIT}
+        order_type = {"Limit": [Price.LIMIT, 1734876543]}
+        call = action_to_call(
+            {"CreateOrder": {**as_int_subclass, "order_type": order_type}}, self.MARKET_INFO
+        )
+        assert call == expected
+
     def test_create_order_sell(self):
         action = {
             "CreateOrder": {
@@ -321,7 +324,7 @@ class TestActionToCall:
         }
         call = action_to_call(action, self.MARKET_INFO)
         assert call["amount"] == 5000000000  # quantity for sell
-        assert call["asset_id"] == bytes.fromhex("11" * 32)  # base asset for sell
+        assert call["asset_id"] == self._HEX_11  # base asset for sell
 
     def test_cancel_order(self):
         action = {
@@ -332,8 +335,8 @@ class TestActionToCall:
         call = action_to_call(action, self.MARKET_INFO)
         assert call["function_selector"] == function_selector("cancel_order")
         assert call["amount"] == 0
-        assert call["asset_id"] == bytes(32)
-        assert call["call_data"] == bytes.fromhex("ff" * 32)
+        assert call["asset_id"] == _ZERO32
+        assert call["call_data"] == self._HEX_FF
 
     def test_settle_balance(self):
         action = {
@@ -344,5 +347,5 @@ class TestActionToCall:
         call = action_to_call(action, self.MARKET_INFO)
         assert call["function_selector"] == function_selector("settle_balance")
         assert call["amount"] == 0
-        expected_identity = encode_identity(1, bytes.fromhex("dd" * 32))
+        expected_identity = encode_identity(1, self._HEX_DD)
         assert call["call_data"] == expected_identity
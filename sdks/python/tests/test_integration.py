@@ -7,19 +7,27 @@ These tests require network access and hit the live testnet API.
 import asyncio
 import contextlib
 import json
-import math
+import os
+import random
+import re
+from functools import lru_cache
+from math import floor, isclose
 from pathlib import Path
+from typing import NamedTuple
 
 import pytest
 
 from o2_sdk import (
     BalanceUpdate,
+    Identity,
     Network,
     NonceUpdate,
     O2Client,
     OrderSide,
     OrderType,
     OrderUpdate,
+    RateLimitExceeded,
+    TraderNotWhitelisted,
     TradeUpdate,
 )
 from o2_sdk.api import O2Api
@@ -30,15 +38,49 @@ pytestmark = pytest.mark.integration
 _WALLET_CACHE_PATH = Path(__file__).resolve().parents[1] / ".integration-wallets.json"
 
 
+_COOLDOWN_SECONDS = 65.0
+
+
+# Whole phrases only: a bare "rate" also matches "generate", "accurate", etc.
+_COOLDOWN_RE = re.compile(
+    r"\b(?:cool[\s-]?down|rate[\s-]?limit(?:ed)?|too many requests|once every)\b",
+    re.IGNORECASE,
+)
+
+
+def _is_cooldown(exc: Exception) -> bool:
+    return isinstance(exc, RateLimitExceeded) or _COOLDOWN_RE.search(str(exc)) is not None
+
+
+async def _backoff(attempt, base=2.0, cap=_COOLDOWN_SECONDS, jitter=0.5):
+    """Sleep ``base * 2**attempt`` seconds (capped), scaled by +/- ``jitter``."""
+    await asyncio.sleep(min(cap, base * 2**attempt) * (1 + random.uniform(-jitter, jitter)))
+
+
+async def _retry_pause(exc: Exception, attempt: int) -> None:
+    """Wait out a faucet/whitelist cooldown in full; back off briefly on anything else."""
+    if _is_cooldown(exc):
+        await asyncio.sleep(_COOLDOWN_SECONDS)
+    else:
+        await _backoff(attempt)
+
+
+# The faucet and whitelist endpoints are rate limited per caller; queue
+# concurrent requests here instead of letting them collide and back off.
+_FAUCET_SEM = asyncio.Semaphore(1)
+_WHITELIST_SEM = asyncio.Semaphore(2)
+
+
 async def _mint_with_retry(api, trade_account_id, max_retries=4):
     """Attempt faucet mint with retry on cooldown."""
     for attempt in range(max_retries):
         try:
-            await api.mint_to_contract(trade_account_id)
+            async with _FAUCET_SEM:
+                await api.mint_to_contract(trade_account_id)
             return
-        except Exception:
+        except Exception as e:
             if attempt < max_retries - 1:
-                await asyncio.sleep(65)
+                await _retry_pause(e, attempt)
 
 
 def _load_cached_wallet(client: O2Client, role: str):
@@ -62,7 +104,10 @@ def _save_cached_wallet(role: str, wallet) -> None:
         except Exception:
             data = {}
     data[role] = "0x" + wallet.private_key.hex()
-    _WALLET_CACHE_PATH.write_text(json.dumps(data, indent=2) + "\n")
+    # Write-then-rename so a crash never leaves a truncated cache behind.
+    tmp_path = _WALLET_CACHE_PATH.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps(data, indent=2) + "\n")
+    os.replace(tmp_path, _WALLET_CACHE_PATH)
 
 
 def _load_or_create_wallet(client: O2Client, role: str):
@@ -74,17 +119,27 @@ def _load_or_create_wallet(client: O2Client, role: str):
     return wallet
 
 
+# Trade accounts whitelisted during this run; whitelisting persists on-chain,
+# so later calls for the same account skip the transaction and the
+# propagation wait.
+_WHITELISTED: set[str] = set()
+
+
 async def _whitelist_with_retry(api, trade_account_id, max_retries=4):
     """Ensure account is whitelisted with retry on rate limit."""
+    if trade_account_id in _WHITELISTED:
+        return
     for attempt in range(max_retries):
         try:
-            await api.whitelist_account(trade_account_id)
+            async with _WHITELIST_SEM:
+                await api.whitelist_account(trade_account_id)
             # Allow time for on-chain whitelist propagation
             await asyncio.sleep(10)
+            _WHITELISTED.add(trade_account_id)
             return
-        except Exception:
+        except Exception as e:
             if attempt < max_retries - 1:
-                await asyncio.sleep(65)
+                await _retry_pause(e, attempt)
 
 
 async def _create_order_with_whitelist_retry(client, max_retries=5, **kwargs):
@@ -93,12 +148,12 @@ async def _create_order_with_whitelist_retry(client, max_retries=5, **kwargs):
     for attempt in range(max_retries):
         try:
             return await client.create_order(**kwargs)
-        except Exception as e:
-            err_text = str(e) + (getattr(e, "reason", None) or "")
-            if "TraderNotWhiteListed" in err_text and attempt < max_retries - 1:
+        except TraderNotWhitelisted:
+            if attempt < max_retries - 1:
                 # Re-whitelist and retry with increasing backoff
                 trade_account_id = session.trade_account_id if session else None
                 if trade_account_id:
+                    _WHITELISTED.discard(trade_account_id)
                     await _whitelist_with_retry(client.api, trade_account_id, max_retries=2)
                     # Additional backoff on top of whitelist propagation delay
                     await asyncio.sleep(5 * (attempt + 1))
@@ -106,9 +161,8 @@ async def _create_order_with_whitelist_retry(client, max_retries=5, **kwargs):
             raise
 
 
-async def _ensure_sufficient_test_balance(client, trade_account_id):
+async def _ensure_sufficient_test_balance(client, trade_account_id, markets_resp):
     """Mint only when account balance is below a conservative test threshold."""
-    markets_resp = await client.api.get_markets()
     min_orders = [int(m.min_order or "0") for m in markets_resp.markets]
     min_required = (max(min_orders) if min_orders else 1_000_000) * 50
     current = await client.api.get_balance(
@@ -121,41 +175,64 @@ async def _ensure_sufficient_test_balance(client, trade_account_id):
     await _mint_with_retry(client.api, trade_account_id)
 
 
-async def _setup_funded_account(client, role, max_retries=4):
+async def _setup_funded_account(client, role, markets_resp, max_retries=4, start_delay=0.0):
     """Create/reuse account, ensure whitelist, and fund only if below threshold."""
+    # A short stagger keeps concurrent setups from hitting testnet rate limits at once.
+    await asyncio.sleep(start_delay)
     wallet = _load_or_create_wallet(client, role)
     for attempt in range(max_retries):
         try:
             account = await client.setup_account(wallet)
             break
-        except Exception:
+        except Exception as e:
             if attempt < max_retries - 1:
-                await asyncio.sleep(65)
+                await _retry_pause(e, attempt)
             else:
                 raise
     # Explicitly whitelist with retry for propagation robustness on testnet.
     await _whitelist_with_retry(client.api, account.trade_account_id)
-    await _ensure_sufficient_test_balance(client, account.trade_account_id)
-    return wallet, account
+    await _ensure_sufficient_test_balance(client, account.trade_account_id, markets_resp)
+    balances = await client.get_balances(account.trade_account_id)
+    return wallet, account, balances
 
 
-@pytest.fixture(scope="module")
-async def funded_accounts():
+@pytest.fixture(scope="session")
+async def testnet_markets():
+    """The testnet markets response, fetched once: the market list is static during a run."""
+    api = O2Api(get_config(Network.TESTNET))
+    try:
+        yield await api.get_markets()
+    finally:
+        await api.close()
+
+
+@pytest.fixture(scope="session")
+async def funded_accounts(testnet_markets):
     """Two funded accounts (maker + taker) for cross-account tests."""
     client = O2Client(network=Network.TESTNET)
-
-    maker_wallet, maker_account = await _setup_funded_account(client, "maker")
-    taker_wallet, taker_account = await _setup_funded_account(client, "taker")
+    client._markets_cache = testnet_markets
+
+    (
+        (maker_wallet, maker_account, maker_balances),
+        (taker_wallet, taker_account, taker_balances),
+    ) = await asyncio.gather(
+        _setup_funded_account(client, "maker", testnet_markets),
+        _setup_funded_account(client, "taker", testnet_markets, start_delay=0.5),
+    )
 
     yield {
         "client": client,
         "maker": (maker_wallet, maker_account),
         "taker": (taker_wallet, taker_account),
+        # Balances right after funding, for checks that only need them present.
+        "maker_balances": maker_balances,
+        "taker_balances": taker_balances,
+        "markets": testnet_markets.markets,
     }
     await client.close()
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 async def funded_account(funded_accounts):
     """Backward-compatible fixture delegating to maker from funded_accounts."""
     ctx = funded_accounts
@@ -163,31 +240,32 @@ async def funded_account(funded_accounts):
     yield ctx["client"], wallet, account
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def config():
     return get_config(Network.TESTNET)
 
 
-@pytest.fixture
-def api(config):
-    return O2Api(config)
+@pytest.fixture(scope="module")
+async def api(config):
+    api = O2Api(config)
+    yield api
+    await api.close()
 
 
-@pytest.fixture(scope="module")
-async def market_snapshot():
+@pytest.fixture(scope="session")
+async def market_snapshot(testnet_markets):
     """Shared read-only market snapshot with parallel depth/trades fetch."""
     api = O2Api(get_config(Network.TESTNET))
     try:
-        markets_resp = await api.get_markets()
-        if not markets_resp.markets:
+        if not testnet_markets.markets:
             pytest.skip("No markets available")
-        market = markets_resp.markets[0]
+        market = testnet_markets.markets[0]
         depth, trades = await asyncio.gather(
             api.get_depth(market.market_id),
             api.get_trades(market.market_id, count=10),
         )
         yield {
-            "markets_resp": markets_resp,
+            "markets_resp": testnet_markets,
             "market": market,
             "depth": depth,
             "trades": trades,
@@ -196,9 +274,12 @@ async def market_snapshot():
         await api.close()
 
 
-@pytest.fixture
-def client():
-    return O2Client(network=Network.TESTNET)
+@pytest.fixture(scope="session")
+async def client():
+    """One client (HTTP session and, once opened, WebSocket) shared per session."""
+    client = O2Client(network=Network.TESTNET)
+    yield client
+    await client.close()
 
 
 class TestMarketData:
@@ -230,7 +311,6 @@ class TestMarketData:
 
         resolved = await client.get_market(pair)
         assert resolved.market_id == first.market_id
-        await client.close()
 
 
 class TestAccountFlow:
@@ -250,7 +330,6 @@ class TestAccountFlow:
         assert account.exists
         assert account.trade_account_id == result.trade_account_id
         assert account.nonce == 0
-        await client.close()
 
     async def test_setup_account_idempotent(self, client):
         wallet = client.generate_wallet()
@@ -262,7 +341,6 @@ class TestAccountFlow:
         # Second call is idempotent
         account2 = await client.setup_account(wallet)
         assert account2.trade_account_id == account1.trade_account_id
-        await client.close()
 
 
 class TestSessionFlow:
@@ -285,19 +363,56 @@ class TestSessionFlow:
         assert len(session.contract_ids) > 0
 
 
+class _MarketConsts(NamedTuple):
+    price_step: float  # smallest quote price increment (human units)
+    base_step: float  # smallest base quantity increment (human units)
+    base_factor: int  # 10^base.decimals
+    quote_factor: int  # 10^quote.decimals
+    base_precision_factor: int  # 10^base.max_precision
+
+
+@lru_cache(maxsize=16)
+def _consts_for(base_decimals, base_precision, quote_decimals, quote_precision):
+    base_precision_factor = 10**base_precision
+    return _MarketConsts(
+        price_step=10 ** (-quote_precision),
+        base_step=1 / base_precision_factor,
+        base_factor=10**base_decimals,
+        quote_factor=10**quote_decimals,
+        base_precision_factor=base_precision_factor,
+    )
+
+
+def _market_consts(market):
+    """Per-market scaling constants, computed once per distinct asset configuration."""
+    return _consts_for(
+        market.base.decimals,
+        market.base.max_precision,
+        market.quote.decimals,
+        market.quote.max_precision,
+    )
+
+
+def _min_order_steps(market, price, multiple_tenths):
+    """Base precision steps needed for ``multiple_tenths / 10`` x min_order at ``price``.
+
+    Pure integer arithmetic: min_order and the price in quote chain units are
+    exact integers, so the ceiling never picks up an extra step from float noise.
+    """
+    consts = _market_consts(market)
+    min_order = int(market.min_order) if market.min_order else 1_000_000
+    # A price below half a quote unit still costs at least one unit on chain.
+    price_chain = max(1, round(price * consts.quote_factor))
+    # min_order * multiple <= price_chain * steps / 10^max_precision, solved for steps.
+    numerator = min_order * multiple_tenths * consts.base_precision_factor
+    return -(-numerator // (10 * price_chain))
+
+
 def _min_quantity_for_min_order(market, price):
     """Calculate minimum quantity that meets min_order at the given price."""
-    min_order = float(market.min_order) if market.min_order else 1_000_000
-    quote_factor = 10**market.quote.decimals
-    base_factor = 10**market.base.decimals
-    # min_order <= price * quote_factor * quantity
-    min_qty = min_order / (price * quote_factor)
-    # Apply margin, then round up to nearest precision step.
-    # Rounding first and multiplying by margin can violate max_precision.
-    truncate_factor = 10 ** (market.base.decimals - market.base.max_precision)
-    step = truncate_factor / base_factor
-    rounded = math.ceil((min_qty * 1.1) / step) * step
-    return rounded
+    # 1.1x margin applied before rounding up to the precision step; rounding
+    # first and multiplying by the margin can violate max_precision.
+    return _min_order_steps(market, price, 11) / _market_consts(market).base_precision_factor
 
 
 def test_min_quantity_for_min_order_rounds_after_margin_to_step():
@@ -318,54 +433,118 @@ def test_min_quantity_for_min_order_rounds_after_margin_to_step():
     min_required_with_margin = (market.min_order / (10**market.quote.decimals)) * 1.1
 
     assert qty >= min_required_with_margin
-    assert math.isclose(qty / step, round(qty / step), rel_tol=0.0, abs_tol=1e-9)
+    assert isclose(qty / step, round(qty / step), rel_tol=0.0, abs_tol=1e-9)
     assert qty == pytest.approx(0.002, abs=1e-12)
 
 
-async def _consume_first(stream):
-    """Get the first item from an async generator (for use as a background task)."""
-    async for update in stream:
-        return update
+async def _consume_first(stream, match=None):
+    """Get the first item ``match`` accepts from an async generator (for use as a background task).
+
+    The WebSocket is shared by every test in the session, so a stream can also
+    see late updates caused by an earlier test; ``match`` ties the result to
+    this test's own order or account.
+    """
+    async with contextlib.aclosing(stream):
+        async for update in stream:
+            if match is None or await match(update):
+                return update
     return None
 
 
+async def _subscribe_first(stream_method, *args, match=None):
+    """Consume the first matching update of a stream in the background, once subscribed."""
+    ready = asyncio.Event()
+    task = asyncio.create_task(_consume_first(stream_method(*args, ready=ready), match))
+    try:
+        await asyncio.wait_for(ready.wait(), timeout=10)
+    except BaseException:
+        task.cancel()
+        raise
+    return task
+
+
+def _has_order(order_id_future):
+    """Match order updates carrying the order whose id ``order_id_future`` resolves to."""
+
+    async def match(update):
+        placed = await order_id_future
+        return any(o.order_id == placed for o in update.orders)
+
+    return match
+
+
+def _trade_by(*trade_account_ids):
+    """Match trade updates where one of ``trade_account_ids`` is maker or taker."""
+
+    async def match(update):
+        return any(
+            party is not None and any(acct == party.value for acct in trade_account_ids)
+            for t in update.trades
+            for party in (t.maker, t.taker)
+        )
+
+    return match
+
+
+def _balance_of(trade_account_id):
+    """Match balance updates with an entry for ``trade_account_id``."""
+
+    async def match(update):
+        return any(
+            entry.get("identity")
+            and trade_account_id == Identity.from_dict(entry["identity"]).value
+            for entry in update.balance
+        )
+
+    return match
+
+
+def _nonce_of(trade_account_id):
+    """Match nonce updates for ``trade_account_id``."""
+
+    async def match(update):
+        return trade_account_id == update.contract_id
+
+    return match
+
+
+async def _unsubscribe(client, *kinds, market=None, trade_account_id=None):
+    """Best-effort server-side unsubscribe of this test's streams on the shared WebSocket."""
+    identities = [{"ContractId": trade_account_id}]
+    with contextlib.suppress(Exception):
+        ws = await client._ensure_ws()
+        calls = {
+            "orders": ws.unsubscribe_orders,
+            "trades": lambda: ws.unsubscribe_trades(market.market_id),
+            "balances": lambda: ws.unsubscribe_balances(identities),
+            "nonce": lambda: ws.unsubscribe_nonce(identities),
+        }
+        await asyncio.gather(*(calls[kind]() for kind in kinds), return_exceptions=True)
+
+
 def _moderate_fill_price(market):
     """Deterministic price for fill tests: min_order * 10^base.max_precision / 10^quote.decimals.
 
     Low enough to avoid walking through expensive stale sells on the book,
     high enough for comfortable order sizing.
     """
+    consts = _market_consts(market)
     min_order = float(market.min_order) if market.min_order else 1_000_000
-    base_precision_factor = 10**market.base.max_precision
-    quote_factor = 10**market.quote.decimals
-    return min_order * base_precision_factor / quote_factor
-
-
-def _fill_quantity(market, price):
-    """Quantity targeting ~10x min_order value for fill tests.
-
-    Rounded up to the nearest base precision step.
-    """
-    min_order = float(market.min_order) if market.min_order else 1_000_000
-    quote_factor = 10**market.quote.decimals
-    base_factor = 10**market.base.decimals
-    qty = 10 * min_order / (price * quote_factor)
-    truncate_factor = 10 ** (market.base.decimals - market.base.max_precision)
-    step = truncate_factor / base_factor
-    return math.ceil(qty / step) * step
+    return min_order * consts.base_precision_factor / consts.quote_factor
 
 
 async def _conservative_post_only_buy_price(client, market):
     """Choose a conservative post-only buy price from live depth when available."""
     fallback = _moderate_fill_price(market)
-    price_step = 10 ** (-market.quote.max_precision)
+    price_step = _market_consts(market).price_step
     try:
         # Use precision=1 (finest) to get accurate best ask/bid prices.
         # Coarser levels aggregate prices into wide buckets, which can cause
         # the chosen price to accidentally cross the actual best ask.
         depth = await client.get_depth(market.pair, precision=1)
-        if depth.best_ask:
-            best_ask = market.format_price(int(depth.best_ask.price))
+        best_ask_level = depth.best_ask
+        if best_ask_level is not None:
+            best_ask = market.format_price(int(best_ask_level.price))
             return max(price_step, best_ask - price_step)
     except Exception as ex:
         # Depth fetch failures are non-fatal; fall back to a conservative price.
@@ -376,7 +555,7 @@ async def _conservative_post_only_buy_price(client, market):
 def _floor_to_step(value, step):
     if step <= 0:
         return value
-    return math.floor(value / step) * step
+    return floor(value / step) * step
 
 
 async def _symbol_balance_chain(client, trade_account_id, symbol):
@@ -398,25 +577,21 @@ async def _cross_fill_quantity(
     min_qty = _min_quantity_for_min_order(market, price)
     target_qty = min_qty * 1.05
 
-    base_decimals = market.base.decimals
-    quote_decimals = market.quote.decimals
-    step = 10 ** (base_decimals - market.base.max_precision) / (10**base_decimals)
+    consts = _market_consts(market)
 
     last_details = ""
     for attempt in range(2):
-        taker_base_chain = await _symbol_balance_chain(
-            client, taker_trade_account_id, market.base.symbol
-        )
-        maker_quote_chain = await _symbol_balance_chain(
-            client, maker_trade_account_id, market.quote.symbol
+        taker_base_chain, maker_quote_chain = await asyncio.gather(
+            _symbol_balance_chain(client, taker_trade_account_id, market.base.symbol),
+            _symbol_balance_chain(client, maker_trade_account_id, market.quote.symbol),
         )
 
-        taker_base_human_cap = (taker_base_chain / (10**base_decimals)) * 0.9
-        maker_quote_human_cap = (maker_quote_chain / (10**quote_decimals)) * 0.9
+        taker_base_human_cap = (taker_base_chain / consts.base_factor) * 0.9
+        maker_quote_human_cap = (maker_quote_chain / consts.quote_factor) * 0.9
         maker_affordable_qty_cap = maker_quote_human_cap / price if price > 0 else 0
 
         cap = min(taker_base_human_cap, maker_affordable_qty_cap)
-        qty = _floor_to_step(min(target_qty, cap), step)
+        qty = _floor_to_step(min(target_qty, cap), consts.base_step)
         last_details = (
             f"min_qty={min_qty}, proposed_qty={qty}, cap={cap}, "
             f"taker_base_chain={taker_base_chain}, maker_quote_chain={maker_quote_chain}, "
@@ -427,8 +602,10 @@ async def _cross_fill_quantity(
 
         if attempt == 0:
             # Refresh funding and retry once before failing invariant.
-            await _mint_with_retry(client.api, maker_trade_account_id, max_retries=2)
-            await _mint_with_retry(client.api, taker_trade_account_id, max_retries=2)
+            await asyncio.gather(
+                _mint_with_retry(client.api, maker_trade_account_id, max_retries=2),
+                _mint_with_retry(client.api, taker_trade_account_id, max_retries=2),
+            )
 
     raise AssertionError(f"Unable to compute valid cross-fill quantity: {last_details}")
 
@@ -437,12 +614,25 @@ async def _cleanup_open_orders(client, wallet, market_pair):
     """Best-effort cleanup: cancel all open orders and settle balance for an account."""
     with contextlib.suppress(Exception):
         session = await client.create_session(owner=wallet, markets=[market_pair], expiry_days=1)
+        # Kept sequential: both calls sign with the session's next nonce.
         with contextlib.suppress(Exception):
             await client.cancel_all_orders(market_pair, session=session)
         with contextlib.suppress(Exception):
             await client.settle_balance(market_pair, session=session)
 
 
+async def _teardown_session(client, market_pair, session, order=None):
+    """Best-effort cancel of ``order`` then settle, one session at a time."""
+    if session is None:
+        return
+    # Kept sequential: both calls sign with the session's next nonce.
+    if order is not None:
+        with contextlib.suppress(Exception):
+            await client.cancel_order(session=session, order_id=order.order_id, market=market_pair)
+    with contextlib.suppress(Exception):
+        await client.settle_balance(market_pair, session=session)
+
+
 class TestTradingFlow:
     async def test_get_nonce(self, funded_account):
         client, _wallet, account = funded_account
@@ -462,7 +652,7 @@ class TestTradingFlow:
         # Re-whitelist before trading (idempotent, handles propagation delays)
         await _whitelist_with_retry(client.api, account.trade_account_id, max_retries=2)
 
-        markets = await client.get_markets()
+        markets = funded_accounts["markets"]
         if not markets:
             pytest.skip("No markets available")
 
@@ -470,12 +660,12 @@ class TestTradingFlow:
 
         # Use minimum price step — guaranteed below any ask on the book.
         # Buy cost is always ≈ min_order regardless of price, so this is affordable.
-        price_step = 10 ** (-market.quote.max_precision)
+        price_step = _market_consts(market).price_step
         buy_price = price_step
         quantity = _min_quantity_for_min_order(market, buy_price)
 
         # Verify we have quote balance
-        balances = await client.get_balances(account.trade_account_id)
+        balances = funded_accounts["maker_balances"]
         quote_symbol = market.quote.symbol
         assert quote_symbol in balances, f"No {quote_symbol} balance after faucet"
         assert int(balances[quote_symbol].trading_account_balance) > 0
@@ -519,18 +709,22 @@ class TestTradingFlow:
         taker_wallet, taker_account = funded_accounts["taker"]
 
         # Re-whitelist both accounts before trading
-        await _whitelist_with_retry(client.api, maker_account.trade_account_id, max_retries=2)
-        await _whitelist_with_retry(client.api, taker_account.trade_account_id, max_retries=2)
+        await asyncio.gather(
+            _whitelist_with_retry(client.api, maker_account.trade_account_id, max_retries=2),
+            _whitelist_with_retry(client.api, taker_account.trade_account_id, max_retries=2),
+        )
 
-        markets = await client.get_markets()
+        markets = funded_accounts["markets"]
         if not markets:
             pytest.skip("No markets available")
 
         market = markets[0]
 
         # Cleanup leaked orders from earlier tests
-        await _cleanup_open_orders(client, maker_wallet, market.pair)
-        await _cleanup_open_orders(client, taker_wallet, market.pair)
+        await asyncio.gather(
+            _cleanup_open_orders(client, maker_wallet, market.pair),
+            _cleanup_open_orders(client, taker_wallet, market.pair),
+        )
 
         # Moderate price below stale sells — maker buy rests safely.
         # Taker FillOrKill sell targets the maker directly, avoiding
@@ -550,12 +744,13 @@ class TestTradingFlow:
         assert quote_symbol in balances, f"No {quote_symbol} balance after faucet"
         assert int(balances[quote_symbol].trading_account_balance) > 0
 
-        # Maker: PostOnly Buy at moderate price → rests below stale sells
-        maker_session = await client.create_session(
-            owner=maker_wallet,
-            markets=[market.pair],
-            expiry_days=1,
+        # Sessions are independent; only the orders must go maker first.
+        maker_session, taker_session = await asyncio.gather(
+            client.create_session(owner=maker_wallet, markets=[market.pair], expiry_days=1),
+            client.create_session(owner=taker_wallet, markets=[market.pair], expiry_days=1),
         )
+
+        # Maker: PostOnly Buy at moderate price → rests below stale sells
         maker_result = await _create_order_with_whitelist_retry(
             client,
             session=maker_session,
@@ -574,11 +769,6 @@ class TestTradingFlow:
         assert maker_order.cancel is not True, "Maker order was unexpectedly cancelled"
 
         # Taker: FillOrKill Sell — fills against maker, never rests on the book
-        taker_session = await client.create_session(
-            owner=taker_wallet,
-            markets=[market.pair],
-            expiry_days=1,
-        )
         taker_result = await _create_order_with_whitelist_retry(
             client,
             session=taker_session,
@@ -602,8 +792,8 @@ class TestTradingFlow:
 
 
 class TestWebSocket:
-    async def test_depth_snapshot(self, client):
-        markets = await client.get_markets()
+    async def test_depth_snapshot(self, client, testnet_markets):
+        markets = testnet_markets.markets
         if not markets:
             pytest.skip("No markets available")
 
@@ -617,43 +807,46 @@ class TestWebSocket:
             break  # Just need one message
 
         assert received
-        await client.close()
 
-    async def test_websocket_trades(self, funded_accounts):
+    async def test_websocket_trades(self, funded_accounts, testnet_markets):
         ctx = funded_accounts
         maker_wallet, maker_account = ctx["maker"]
         taker_wallet, taker_account = ctx["taker"]
 
         # Re-whitelist both accounts before trading
-        await _whitelist_with_retry(
-            ctx["client"].api, maker_account.trade_account_id, max_retries=2
-        )
-        await _whitelist_with_retry(
-            ctx["client"].api, taker_account.trade_account_id, max_retries=2
+        await asyncio.gather(
+            _whitelist_with_retry(ctx["client"].api, maker_account.trade_account_id, max_retries=2),
+            _whitelist_with_retry(ctx["client"].api, taker_account.trade_account_id, max_retries=2),
         )
 
-        ws_client = O2Client(network=Network.TESTNET)
+        ws_client = ctx["client"]
         consumer = None
         maker_session = None
         taker_session = None
         maker_order = None
         taker_order = None
+        market = None
         try:
-            markets = await ws_client.get_markets()
+            markets = testnet_markets.markets
             if not markets:
                 pytest.skip("No markets available")
             market = markets[0]
 
             # Cleanup leaked orders from earlier tests
-            await _cleanup_open_orders(ws_client, maker_wallet, market.pair)
-            await _cleanup_open_orders(ws_client, taker_wallet, market.pair)
-
-            # Subscribe to trades stream via background task
-            consumer = asyncio.create_task(_consume_first(ws_client.stream_trades(market.pair)))
-            await asyncio.sleep(2)  # Wait for subscription to propagate
+            await asyncio.gather(
+                _cleanup_open_orders(ws_client, maker_wallet, market.pair),
+                _cleanup_open_orders(ws_client, taker_wallet, market.pair),
+            )
 
-            # Deterministic pricing
-            fill_price = await _conservative_post_only_buy_price(ws_client, market)
+            # Subscribe to trades in the background while pricing the fill
+            consumer, fill_price = await asyncio.gather(
+                _subscribe_first(
+                    ws_client.stream_trades,
+                    market.pair,
+                    match=_trade_by(maker_account.trade_account_id, taker_account.trade_account_id),
+                ),
+                _conservative_post_only_buy_price(ws_client, market),
+            )
             quantity = await _cross_fill_quantity(
                 ws_client,
                 market,
@@ -662,10 +855,13 @@ class TestWebSocket:
                 taker_account.trade_account_id,
             )
 
-            # Maker: PostOnly Buy at moderate price — rests below stale sells
-            maker_session = await ws_client.create_session(
-                owner=maker_wallet, markets=[market.pair], expiry_days=1
+            # Sessions are independent; only the orders must go maker first.
+            maker_session, taker_session = await asyncio.gather(
+                ws_client.create_session(owner=maker_wallet, markets=[market.pair], expiry_days=1),
+                ws_client.create_session(owner=taker_wallet, markets=[market.pair], expiry_days=1),
             )
+
+            # Maker: PostOnly Buy at moderate price — rests below stale sells
             maker_result = await _create_order_with_whitelist_retry(
                 ws_client,
                 session=maker_session,
@@ -683,9 +879,6 @@ class TestWebSocket:
             assert maker_order.cancel is not True, "Maker order was unexpectedly cancelled"
 
             # Taker: FillOrKill Sell — fills against maker, never rests
-            taker_session = await ws_client.create_session(
-                owner=taker_wallet, markets=[market.pair], expiry_days=1
-            )
             taker_result = await _create_order_with_whitelist_retry(
                 ws_client,
                 session=taker_session,
@@ -703,7 +896,7 @@ class TestWebSocket:
 
             # Wait for trade update — MUST arrive after cross-account fill
             try:
-                update = await asyncio.wait_for(consumer, timeout=30)
+                update = await asyncio.wait_for(consumer, timeout=15)
                 consumer = None  # Task completed
                 assert update is not None
                 assert isinstance(update, TradeUpdate)
@@ -716,29 +909,16 @@ class TestWebSocket:
                 consumer.cancel()
                 with contextlib.suppress(asyncio.CancelledError):
                     await consumer
-            with contextlib.suppress(Exception):
-                if maker_session and maker_order:
-                    await ws_client.cancel_order(
-                        session=maker_session,
-                        order_id=maker_order.order_id,
-                        market=market.pair,
-                    )
-            with contextlib.suppress(Exception):
-                if taker_session and taker_order:
-                    await ws_client.cancel_order(
-                        session=taker_session,
-                        order_id=taker_order.order_id,
-                        market=market.pair,
-                    )
-            with contextlib.suppress(Exception):
-                if maker_session:
-                    await ws_client.settle_balance(market.pair, session=maker_session)
-            with contextlib.suppress(Exception):
-                if taker_session:
-                    await ws_client.settle_balance(market.pair, session=taker_session)
-            await ws_client.close()
+            if market is not None:
+                await _unsubscribe(ws_client, "trades", market=market)
+            if maker_session or taker_session:
+                await asyncio.gather(
+                    _teardown_session(ws_client, market.pair, maker_session, maker_order),
+                    _teardown_session(ws_client, market.pair, taker_session, taker_order),
+                    return_exceptions=True,
+                )
 
-    async def test_websocket_orders(self, funded_accounts):
+    async def test_websocket_orders(self, funded_accounts, testnet_markets):
         ctx = funded_accounts
         maker_wallet, maker_account = ctx["maker"]
 
@@ -746,26 +926,29 @@ class TestWebSocket:
             ctx["client"].api, maker_account.trade_account_id, max_retries=2
         )
 
-        ws_client = O2Client(network=Network.TESTNET)
+        ws_client = ctx["client"]
         consumer = None
         session = None
         order_id = None
+        market = None
         try:
-            markets = await ws_client.get_markets()
+            markets = testnet_markets.markets
             if not markets:
                 pytest.skip("No markets available")
             market = markets[0]
 
             await _cleanup_open_orders(ws_client, maker_wallet, market.pair)
 
-            # Subscribe to orders for maker account
-            consumer = asyncio.create_task(
-                _consume_first(ws_client.stream_orders(maker_account.trade_account_id))
+            # Subscribe to orders for maker account, matching the order placed below
+            placed_order_id = asyncio.get_running_loop().create_future()
+            consumer = await _subscribe_first(
+                ws_client.stream_orders,
+                maker_account.trade_account_id,
+                match=_has_order(placed_order_id),
             )
-            await asyncio.sleep(2)
 
             # PostOnly Buy at minimum price step
-            price_step = 10 ** (-market.quote.max_precision)
+            price_step = _market_consts(market).price_step
             quantity = _min_quantity_for_min_order(market, price_step)
 
             session = await ws_client.create_session(
@@ -783,8 +966,9 @@ class TestWebSocket:
                 collect_orders=True,
             )
             assert result.tx_id is not None, f"Order placement failed: {result.message}"
-            if result.orders:
-                order_id = result.orders[0].order_id
+            assert result.orders, "Order placement returned no orders"
+            order_id = result.orders[0].order_id
+            placed_order_id.set_result(order_id)
 
             # MUST receive order update
             try:
@@ -802,15 +986,15 @@ class TestWebSocket:
                 consumer.cancel()
                 with contextlib.suppress(asyncio.CancelledError):
                     await consumer
+            await _unsubscribe(ws_client, "orders", trade_account_id=maker_account.trade_account_id)
             with contextlib.suppress(Exception):
                 if session and order_id:
                     await ws_client.cancel_order(
                         session=session, order_id=order_id, market=market.pair
                     )
                     await ws_client.settle_balance(market.pair, session=session)
-            await ws_client.close()
 
-    async def test_websocket_balances(self, funded_accounts):
+    async def test_websocket_balances(self, funded_accounts, testnet_markets):
         ctx = funded_accounts
         maker_wallet, maker_account = ctx["maker"]
 
@@ -818,12 +1002,13 @@ class TestWebSocket:
             ctx["client"].api, maker_account.trade_account_id, max_retries=2
         )
 
-        ws_client = O2Client(network=Network.TESTNET)
+        ws_client = ctx["client"]
         consumer = None
         session = None
         order_id = None
+        market = None
         try:
-            markets = await ws_client.get_markets()
+            markets = testnet_markets.markets
             if not markets:
                 pytest.skip("No markets available")
             market = markets[0]
@@ -831,13 +1016,14 @@ class TestWebSocket:
             await _cleanup_open_orders(ws_client, maker_wallet, market.pair)
 
             # Subscribe to balances for maker account
-            consumer = asyncio.create_task(
-                _consume_first(ws_client.stream_balances(maker_account.trade_account_id))
+            consumer = await _subscribe_first(
+                ws_client.stream_balances,
+                maker_account.trade_account_id,
+                match=_balance_of(maker_account.trade_account_id),
             )
-            await asyncio.sleep(2)
 
             # PostOnly Buy at minimum price step — locks balance
-            price_step = 10 ** (-market.quote.max_precision)
+            price_step = _market_consts(market).price_step
             quantity = _min_quantity_for_min_order(market, price_step)
 
             session = await ws_client.create_session(
@@ -874,15 +1060,17 @@ class TestWebSocket:
                 consumer.cancel()
                 with contextlib.suppress(asyncio.CancelledError):
                     await consumer
+            await _unsubscribe(
+                ws_client, "balances", trade_account_id=maker_account.trade_account_id
+            )
             with contextlib.suppress(Exception):
                 if session and order_id:
                     await ws_client.cancel_order(
                         session=session, order_id=order_id, market=market.pair
                     )
                     await ws_client.settle_balance(market.pair, session=session)
-            await ws_client.close()
 
-    async def test_websocket_nonce(self, funded_accounts):
+    async def test_websocket_nonce(self, funded_accounts, testnet_markets):
         ctx = funded_accounts
         maker_wallet, maker_account = ctx["maker"]
 
@@ -890,12 +1078,13 @@ class TestWebSocket:
             ctx["client"].api, maker_account.trade_account_id, max_retries=2
         )
 
-        ws_client = O2Client(network=Network.TESTNET)
+        ws_client = ctx["client"]
         consumer = None
         session = None
         order_id = None
+        market = None
         try:
-            markets = await ws_client.get_markets()
+            markets = testnet_markets.markets
             if not markets:
                 pytest.skip("No markets available")
             market = markets[0]
@@ -903,13 +1092,14 @@ class TestWebSocket:
             await _cleanup_open_orders(ws_client, maker_wallet, market.pair)
 
             # Subscribe to nonce for maker account
-            consumer = asyncio.create_task(
-                _consume_first(ws_client.stream_nonce(maker_account.trade_account_id))
+            consumer = await _subscribe_first(
+                ws_client.stream_nonce,
+                maker_account.trade_account_id,
+                match=_nonce_of(maker_account.trade_account_id),
             )
-            await asyncio.sleep(2)
 
             # PostOnly Buy at minimum price step — bumps nonce
-            price_step = 10 ** (-market.quote.max_precision)
+            price_step = _market_consts(market).price_step
             quantity = _min_quantity_for_min_order(market, price_step)
 
             session = await ws_client.create_session(
@@ -946,15 +1136,15 @@ class TestWebSocket:
                 consumer.cancel()
                 with contextlib.suppress(asyncio.CancelledError):
                     await consumer
+            await _unsubscribe(ws_client, "nonce", trade_account_id=maker_account.trade_account_id)
             with contextlib.suppress(Exception):
                 if session and order_id:
                     await ws_client.cancel_order(
                         session=session, order_id=order_id, market=market.pair
                     )
                     await ws_client.settle_balance(market.pair, session=session)
-            await ws_client.close()
 
-    async def test_websocket_concurrent_subscriptions(self, funded_accounts):
+    async def test_websocket_concurrent_subscriptions(self, funded_accounts, testnet_markets):
         """Subscribe to orders, balances, and nonce simultaneously;
         place one order and verify each stream receives only its correct type."""
         ctx = funded_accounts
@@ -964,14 +1154,15 @@ class TestWebSocket:
             ctx["client"].api, maker_account.trade_account_id, max_retries=2
         )
 
-        ws_client = O2Client(network=Network.TESTNET)
+        ws_client = ctx["client"]
         orders_consumer = None
         balances_consumer = None
         nonce_consumer = None
         session = None
         order_id = None
+        market = None
         try:
-            markets = await ws_client.get_markets()
+            markets = testnet_markets.markets
             if not markets:
                 pytest.skip("No markets available")
             market = markets[0]
@@ -979,19 +1170,25 @@ class TestWebSocket:
             await _cleanup_open_orders(ws_client, maker_wallet, market.pair)
 
             # Subscribe to all three streams concurrently on one WS connection
-            orders_consumer = asyncio.create_task(
-                _consume_first(ws_client.stream_orders(maker_account.trade_account_id))
+            placed_order_id = asyncio.get_running_loop().create_future()
+            orders_consumer = await _subscribe_first(
+                ws_client.stream_orders,
+                maker_account.trade_account_id,
+                match=_has_order(placed_order_id),
             )
-            balances_consumer = asyncio.create_task(
-                _consume_first(ws_client.stream_balances(maker_account.trade_account_id))
+            balances_consumer = await _subscribe_first(
+                ws_client.stream_balances,
+                maker_account.trade_account_id,
+                match=_balance_of(maker_account.trade_account_id),
             )
-            nonce_consumer = asyncio.create_task(
-                _consume_first(ws_client.stream_nonce(maker_account.trade_account_id))
+            nonce_consumer = await _subscribe_first(
+                ws_client.stream_nonce,
+                maker_account.trade_account_id,
+                match=_nonce_of(maker_account.trade_account_id),
             )
-            await asyncio.sleep(2)
 
             # Place one order — triggers orders, balances, and nonce updates
-            price_step = 10 ** (-market.quote.max_precision)
+            price_step = _market_consts(market).price_step
             quantity = _min_quantity_for_min_order(market, price_step)
 
             session = await ws_client.create_session(
@@ -1009,8 +1206,9 @@ class TestWebSocket:
                 collect_orders=True,
             )
             assert result.tx_id is not None, f"Order placement failed: {result.message}"
-            if result.orders:
-                order_id = result.orders[0].order_id
+            assert result.orders, "Order placement returned no orders"
+            order_id = result.orders[0].order_id
+            placed_order_id.set_result(order_id)
 
             # Each stream must deliver the correct type — no cross-contamination
             try:
@@ -1052,58 +1250,78 @@ class TestWebSocket:
                     consumer.cancel()
                     with contextlib.suppress(asyncio.CancelledError):
                         await consumer
+            await _unsubscribe(
+                ws_client,
+                "orders",
+                "balances",
+                "nonce",
+                trade_account_id=maker_account.trade_account_id,
+            )
             with contextlib.suppress(Exception):
                 if session and order_id:
                     await ws_client.cancel_order(
                         session=session, order_id=order_id, market=market.pair
                     )
                     await ws_client.settle_balance(market.pair, session=session)
-            await ws_client.close()
 
-    async def test_websocket_mixed_with_fill(self, funded_accounts):
+    async def test_websocket_mixed_with_fill(self, funded_accounts, testnet_markets):
         """Subscribe to trades, orders, and balances; execute a cross-account fill
         and verify each stream gets only its own type."""
         ctx = funded_accounts
         maker_wallet, maker_account = ctx["maker"]
         taker_wallet, taker_account = ctx["taker"]
 
-        await _whitelist_with_retry(
-            ctx["client"].api, maker_account.trade_account_id, max_retries=2
-        )
-        await _whitelist_with_retry(
-            ctx["client"].api, taker_account.trade_account_id, max_retries=2
+        await asyncio.gather(
+            _whitelist_with_retry(ctx["client"].api, maker_account.trade_account_id, max_retries=2),
+            _whitelist_with_retry(ctx["client"].api, taker_account.trade_account_id, max_retries=2),
         )
 
-        ws_client = O2Client(network=Network.TESTNET)
+        ws_client = ctx["client"]
         trades_consumer = None
         orders_consumer = None
         balances_consumer = None
         maker_session = None
         taker_session = None
         maker_order = None
+        market = None
         try:
-            markets = await ws_client.get_markets()
+            markets = testnet_markets.markets
             if not markets:
                 pytest.skip("No markets available")
             market = markets[0]
 
-            await _cleanup_open_orders(ws_client, maker_wallet, market.pair)
-            await _cleanup_open_orders(ws_client, taker_wallet, market.pair)
-
-            # Subscribe to all three streams
-            trades_consumer = asyncio.create_task(
-                _consume_first(ws_client.stream_trades(market.pair))
+            await asyncio.gather(
+                _cleanup_open_orders(ws_client, maker_wallet, market.pair),
+                _cleanup_open_orders(ws_client, taker_wallet, market.pair),
             )
-            orders_consumer = asyncio.create_task(
-                _consume_first(ws_client.stream_orders(maker_account.trade_account_id))
-            )
-            balances_consumer = asyncio.create_task(
-                _consume_first(ws_client.stream_balances(maker_account.trade_account_id))
+
+            # Subscribe to all three streams while pricing the fill
+            placed_order_id = asyncio.get_running_loop().create_future()
+            (
+                trades_consumer,
+                orders_consumer,
+                balances_consumer,
+                fill_price,
+            ) = await asyncio.gather(
+                _subscribe_first(
+                    ws_client.stream_trades,
+                    market.pair,
+                    match=_trade_by(maker_account.trade_account_id, taker_account.trade_account_id),
+                ),
+                _subscribe_first(
+                    ws_client.stream_orders,
+                    maker_account.trade_account_id,
+                    match=_has_order(placed_order_id),
+                ),
+                _subscribe_first(
+                    ws_client.stream_balances,
+                    maker_account.trade_account_id,
+                    match=_balance_of(maker_account.trade_account_id),
+                ),
+                _conservative_post_only_buy_price(ws_client, market),
             )
-            await asyncio.sleep(2)
 
             # Cross-account fill
-            fill_price = await _conservative_post_only_buy_price(ws_client, market)
             quantity = await _cross_fill_quantity(
                 ws_client,
                 market,
@@ -1112,9 +1330,12 @@ class TestWebSocket:
                 taker_account.trade_account_id,
             )
 
-            maker_session = await ws_client.create_session(
-                owner=maker_wallet, markets=[market.pair], expiry_days=1
+            # Sessions are independent; only the orders must go maker first.
+            maker_session, taker_session = await asyncio.gather(
+                ws_client.create_session(owner=maker_wallet, markets=[market.pair], expiry_days=1),
+                ws_client.create_session(owner=taker_wallet, markets=[market.pair], expiry_days=1),
             )
+
             maker_result = await _create_order_with_whitelist_retry(
                 ws_client,
                 session=maker_session,
@@ -1129,10 +1350,8 @@ class TestWebSocket:
             assert maker_result.tx_id is not None
             assert maker_result.orders and len(maker_result.orders) > 0
             maker_order = maker_result.orders[0]
+            placed_order_id.set_result(maker_order.order_id)
 
-            taker_session = await ws_client.create_session(
-                owner=taker_wallet, markets=[market.pair], expiry_days=1
-            )
             await _create_order_with_whitelist_retry(
                 ws_client,
                 session=taker_session,
@@ -1147,19 +1366,19 @@ class TestWebSocket:
 
             # Each stream must deliver the correct type
             try:
-                trades_update = await asyncio.wait_for(trades_consumer, timeout=30)
+                trades_update = await asyncio.wait_for(trades_consumer, timeout=15)
                 trades_consumer = None
             except asyncio.TimeoutError:
                 pytest.fail("Trades stream timed out after cross-account fill")
 
             try:
-                orders_update = await asyncio.wait_for(orders_consumer, timeout=30)
+                orders_update = await asyncio.wait_for(orders_consumer, timeout=15)
                 orders_consumer = None
             except asyncio.TimeoutError:
                 pytest.fail("Orders stream timed out after cross-account fill")
 
             try:
-                balances_update = await asyncio.wait_for(balances_consumer, timeout=30)
+                balances_update = await asyncio.wait_for(balances_consumer, timeout=15)
                 balances_consumer = None
             except asyncio.TimeoutError:
                 pytest.fail("Balances stream timed out after cross-account fill")
@@ -1185,17 +1404,18 @@ class TestWebSocket:
                     consumer.cancel()
                     with contextlib.suppress(asyncio.CancelledError):
                         await consumer
-            with contextlib.suppress(Exception):
-                if maker_session and maker_order:
-                    await ws_client.cancel_order(
-                        session=maker_session,
-                        order_id=maker_order.order_id,
-                        market=market.pair,
-                    )
-            with contextlib.suppress(Exception):
-                if maker_session:
-                    await ws_client.settle_balance(market.pair, session=maker_session)
-            with contextlib.suppress(Exception):
-                if taker_session:
-                    await ws_client.settle_balance(market.pair, session=taker_session)
-            await ws_client.close()
+            if market is not None:
+                await _unsubscribe(
+                    ws_client,
+                    "trades",
+                    "orders",
+                    "balances",
+                    market=market,
+                    trade_account_id=maker_account.trade_account_id,
+                )
+            if maker_session or taker_session:
+                await asyncio.gather(
+                    _teardown_session(ws_client, market.pair, maker_session, maker_order),
+                    _teardown_session(ws_client, market.pair, taker_session),
+                    return_exceptions=True,
+                )
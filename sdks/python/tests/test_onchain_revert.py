@@ -12,7 +12,7 @@ from __future__ import annotations
 
 import pytest
 
-from o2_sdk.errors import OnChainRevert, raise_for_error
+from o2_sdk.errors import OnChainRevert, TraderNotWhitelisted, raise_for_error
 from o2_sdk.onchain_revert import augment_revert_reason
 
 # ---------------------------------------------------------------------------
@@ -240,6 +240,22 @@ def test_raise_for_error_decodes_on_chain_revert():
     assert "OrderPartiallyFilled" in str(err)
 
 
+@pytest.mark.parametrize(
+    "reason",
+    [
+        'LogResult { results: [Ok("IncrementNonceEvent"), Ok("TraderNotWhiteListed")] }',
+        'LogResult { results: [Ok("TraderNotWhitelisted")] }',
+    ],
+)
+def test_raise_for_error_types_not_whitelisted_revert(reason):
+    data = {"message": "Failed to process transaction", "reason": reason}
+    with pytest.raises(TraderNotWhitelisted) as exc_info:
+        raise_for_error(data)
+
+    assert isinstance(exc_info.value, OnChainRevert)
+    assert "not whitelisted" in exc_info.value.reason
+
+
 def test_raise_for_error_no_revert_code_keeps_original_reason():
     """Plain API errors without on-chain evidence raise O2Error, not OnChainRevert."""
     from o2_sdk.errors import O2Error
@@ -0,0 +1,341 @@
+"""Unit tests for O2WebSocket message routing (no network)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+
+import pytest
+
+from o2_sdk import ConnectionState, OrderUpdate
+from o2_sdk.config import Network, get_config
+from o2_sdk.websocket import O2WebSocket, _is_routable, _SubscriberChannel, install_uvloop
+
+_ORDERS_MSG = {
+    "action": "subscribe_orders",
+    "orders": [
+        {
+            "order_id": "0x01",
+            "side": "Buy",
+            "order_type": "Spot",
+            "price": "100",
+            "quantity": "50",
+            "timestamp": "0",
+            "close": False,
+        }
+    ],
+}
+
+
+async def _drain(channel: _SubscriberChannel) -> list:
+    channel.close()
+    return [msg async for msg in channel]
+
+
+async def test_dispatch_builds_model_once_for_all_subscribers():
+    ws = O2WebSocket(get_config(Network.TESTNET))
+    ch1 = ws._register_channel("orders")
+    ch2 = ws._register_channel("orders")
+
+    ws._dispatch("subscribe_orders", _ORDERS_MSG)
+
+    [first] = await _drain(ch1)
+    assert isinstance(first, OrderUpdate)
+    assert first.orders[0].price == "100"
+    assert await _drain(ch2) == [first]
+
+
+def test_dispatch_drops_malformed_message():
+    ws = O2WebSocket(get_config(Network.TESTNET))
+    ch = ws._register_channel("trades")
+
+    # TradeUpdate requires a hex market_id; the message is dropped, not raised.
+    ws._dispatch("subscribe_trades", {"action": "subscribe_trades", "trades": []})
+
+    assert len(ch) == 0
+
+
+async def test_dispatch_routes_market_scoped_messages_by_market_id():
+    ws = O2WebSocket(get_config(Network.TESTNET))
+    market_a = "0x" + "aa" * 32
+    market_b = "0x" + "bb" * 32
+    ch_a = ws._register_channel("trades", market_a)
+    ch_b = ws._register_channel("trades", market_b)
+
+    # Server-side IDs may arrive without the 0x prefix or in a different case.
+    ws._dispatch(
+        "subscribe_trades",
+        {"action": "subscribe_trades", "market_id": "AA" * 32, "trades": []},
+    )
+
+    [update] = await _drain(ch_a)
+    assert update.market_id == market_a
+    assert len(ch_b) == 0
+
+    ws._unregister_channel("trades", ch_a, market_a)
+    assert ("trades", "aa" * 32) not in ws._subscriber_channels
+
+
+async def test_dispatch_fans_out_to_unscoped_and_market_subscribers():
+    ws = O2WebSocket(get_config(Network.TESTNET))
+    market = "0x" + "aa" * 32
+    scoped = ws._register_channel("trades", market)
+    unscoped = ws._register_channel("trades")
+
+    ws._dispatch(
+        "subscribe_trades", {"action": "subscribe_trades", "market_id": market, "trades": []}
+    )
+
+    [update] = await _drain(scoped)
+    assert await _drain(unscoped) == [update]
+    assert len(ws._subscriber_channels[("trades", None)]) == 1
+
+
+async def test_channel_drops_oldest_when_full_and_drains_before_close():
+    channel = _SubscriberChannel(maxlen=2)
+    for i in range(3):
+        channel.push(i)
+    assert channel.full
+
+    assert await _drain(channel) == [1, 2]
+
+
+async def test_close_all_channels_discards_data_but_keeps_lifecycle_events():
+    ws = O2WebSocket(get_config(Network.TESTNET))
+    data = ws._register_channel("orders")
+    lifecycle = ws._register_channel("lifecycle")
+    ws._dispatch("subscribe_orders", _ORDERS_MSG)
+    ws._emit_lifecycle(ConnectionState.CLOSED, message="test")
+
+    ws._close_all_channels()
+
+    assert [msg async for msg in data] == []
+    assert [event.state async for event in lifecycle] == [ConnectionState.CLOSED]
+
+
+async def test_closing_a_stream_early_releases_its_channel():
+    ws = O2WebSocket(get_config(Network.TESTNET))
+    ws._should_run = True
+    market = "0x" + "aa" * 32
+    msg = {"action": "subscribe_trades", "market_id": market, "trades": []}
+    stream = ws.stream_trades(market)
+
+    first = asyncio.create_task(anext(stream))
+    await asyncio.sleep(0)
+    ws._dispatch("subscribe_trades", msg)
+    ws._dispatch("subscribe_trades", msg)
+    await first
+    [channel] = ws._subscriber_channels[("trades", "aa" * 32)]
+
+    await stream.aclose()
+
+    assert len(channel) == 0
+    assert ("trades", "aa" * 32) not in ws._subscriber_channels
+
+
+def test_is_routable_skips_frames_without_a_routed_action():
+    assert _is_routable(json.dumps(_ORDERS_MSG))
+    assert _is_routable(b'{"action": "subscribe_depth_update", "changes": {}}')
+    assert not _is_routable('{"action":"pong"}')
+    assert not _is_routable('{"action":"subscribe_depth_snapshot_v2"}')
+
+
+def test_add_subscription_encodes_each_frame_once():
+    ws = O2WebSocket(get_config(Network.TESTNET))
+    sub = {"action": "subscribe_trades", "market_id": "0x" + "aa" * 32}
+
+    payload = ws._add_subscription(sub)
+
+    assert json.loads(payload) == sub
+    assert ws._add_subscription(dict(reversed(sub.items()))) == payload
+    assert ws._subscriptions == {("subscribe_trades", sub["market_id"]): {payload: sub}}
+
+
+async def test_unsubscribe_stops_tracking_subscription():
+    ws = O2WebSocket(get_config(Network.TESTNET))
+    market_a = "0x" + "aa" * 32
+    market_b = "0x" + "bb" * 32
+    ws._add_subscription({"action": "subscribe_trades", "market_id": market_a})
+    ws._add_subscription({"action": "subscribe_trades", "market_id": market_b})
+
+    await ws.unsubscribe_trades(market_a)
+
+    assert list(ws._subscriptions) == [("subscribe_trades", market_b)]
+    # Re-subscribing after an unsubscribe is tracked again, not deduplicated away.
+    ws._add_subscription({"action": "subscribe_trades", "market_id": market_a})
+    assert len(ws._subscriptions) == 2
+
+
+class _FakeConnection:
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+
+    async def send(self, payload: str) -> None:
+        self.sent.append(payload)
+
+
+async def test_reconnect_resends_all_tracked_frames(monkeypatch: pytest.MonkeyPatch):
+    ws = O2WebSocket(get_config(Network.TESTNET))
+    frames = {
+        ws._add_subscription({"action": "subscribe_trades", "market_id": "0x" + "aa" * 32}),
+        ws._add_subscription({"action": "subscribe_nonce", "identities": [{"Address": "0x01"}]}),
+    }
+    conn = _FakeConnection()
+
+    async def fake_connect(_url: str) -> _FakeConnection:
+        return conn
+
+    monkeypatch.setattr("o2_sdk.websocket.websockets.connect", fake_connect)
+    await ws._do_connect()
+
+    assert sorted(conn.sent) == sorted(frames)
+
+
+async def test_unsubscribe_orders_sends_cached_frame():
+    ws = O2WebSocket(get_config(Network.TESTNET))
+    conn = _FakeConnection()
+    ws._ws = conn  # type: ignore[assignment]
+    ws._add_subscription({"action": "subscribe_orders", "identities": [{"Address": "0x01"}]})
+
+    await ws.unsubscribe_orders()
+
+    assert [json.loads(frame) for frame in conn.sent] == [{"action": "unsubscribe_orders"}]
+    assert ws._subscriptions == {}
+
+
+def test_install_uvloop_without_uvloop_keeps_default_policy(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+
+    assert install_uvloop() is False
+
+
+class _BurstConnection:
+    """Returns buffered frames without suspending, like a saturated socket."""
+
+    def __init__(self, frames: list[str]) -> None:
+        self._frames = iter(frames)
+
+    async def recv(self) -> str:
+        for frame in self._frames:
+            return frame
+        await asyncio.Event().wait()
+        raise AssertionError("unreachable")
+
+
+async def test_listener_yields_to_consumers_during_a_burst():
+    ws = O2WebSocket(get_config(Network.TESTNET))
+    ws._should_run = True
+    ws._connected = True
+    ws._ws = _BurstConnection([json.dumps(_ORDERS_MSG)] * 200)  # type: ignore[assignment]
+    channel = ws._register_channel("orders")
+
+    listener = asyncio.create_task(ws._listen())
+    await asyncio.sleep(0)
+
+    try:
+        assert len(channel) == 64
+    finally:
+        ws._should_run = False
+        listener.cancel()
+        await listener
+
+
+async def test_listener_decodes_large_frames_off_the_event_loop():
+    ws = O2WebSocket(get_config(Network.TESTNET))
+    ws._should_run = True
+    ws._connected = True
+    padded = dict(_ORDERS_MSG, padding="x" * (64 * 1024))
+    ws._ws = _BurstConnection([json.dumps(padded), json.dumps(_ORDERS_MSG)])  # type: ignore[assignment]
+    channel = ws._register_channel("orders")
+
+    listener = asyncio.create_task(ws._listen())
+    try:
+        updates = [await asyncio.wait_for(anext(channel), timeout=5) for _ in range(2)]
+        assert [u.orders[0].price for u in updates] == ["100", "100"]
+    finally:
+        ws._should_run = False
+        listener.cancel()
+        await listener
+
+
+class _PingCounter:
+    def __init__(self) -> None:
+        self.pings = 0
+
+    async def ping(self) -> asyncio.Future[float]:
+        self.pings += 1
+        pong: asyncio.Future[float] = asyncio.get_running_loop().create_future()
+        pong.set_result(0.0)
+        return pong
+
+
+class _ManualSleep:
+    """Stands in for ``asyncio.sleep`` so each ping interval ends only on ``elapse()``."""
+
+    def __init__(self) -> None:
+        self._waiters: asyncio.Queue[asyncio.Future[None]] = asyncio.Queue()
+
+    async def __call__(self, _delay: float) -> None:
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.put_nowait(waiter)
+        await waiter
+
+    async def sleeping(self) -> None:
+        """Wait until the loop is inside an interval."""
+        waiter = await self._waiters.get()
+        self._waiters.put_nowait(waiter)
+
+    async def elapse(self) -> None:
+        """End the current interval and wait for the loop to start the next one."""
+        (await self._waiters.get()).set_result(None)
+        await self.sleeping()
+
+
+async def test_ping_loop_only_pings_idle_connections(monkeypatch: pytest.MonkeyPatch):
+    clock = _ManualSleep()
+    monkeypatch.setattr("o2_sdk.websocket.asyncio.sleep", clock)
+    ws = O2WebSocket(get_config(Network.TESTNET))
+    ws._should_run = True
+    ws._connected = True
+    conn = _PingCounter()
+    ws._ws = conn  # type: ignore[assignment]
+
+    pinger = asyncio.create_task(ws._ping_loop())
+    try:
+        await clock.sleeping()
+        for _ in range(3):  # a frame arrives during each interval
+            ws._recv_seq += 1
+            await clock.elapse()
+        assert conn.pings == 0
+
+        await clock.elapse()  # idle interval: ping resumes
+        assert conn.pings == 1
+    finally:
+        ws._should_run = False
+        pinger.cancel()
+        await pinger
+
+
+class _EchoConnection:
+    """Answers each subscribe frame with an update dispatched during ``send``."""
+
+    def __init__(self, ws: O2WebSocket) -> None:
+        self._ws = ws
+
+    async def send(self, payload: str) -> None:
+        self._ws._dispatch("subscribe_orders", _ORDERS_MSG)
+
+
+async def test_stream_sets_ready_once_subscribed_and_keeps_the_first_reply():
+    ws = O2WebSocket(get_config(Network.TESTNET))
+    ws._should_run = True
+    ws._ws = _EchoConnection(ws)  # type: ignore[assignment]
+    ready = asyncio.Event()
+    stream = ws.stream_orders([{"ContractId": "0x01"}], ready=ready)
+
+    first = asyncio.create_task(anext(stream))
+    await asyncio.wait_for(ready.wait(), timeout=5)
+
+    assert (await first).orders[0].price == "100"
+    await stream.aclose()